@@ -1,27 +1,37 @@
 import asyncio
 import sys
-from dotenv import load_dotenv
 
-load_dotenv()
+# uvloop is optional - fall back to the stdlib loop where it isn't installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 sys.path.insert(0, "src")
 
+import _env  # noqa: F401  (loads .env once)
+
 from workflow.graph import run_workflow
 from agents import print_markdown
+from agents.tools import aclose_search_http_client
 
 
 async def main():
     # run_workflow expects categories (list of strings), mode, and debug
     # For "all categories" use a general mode with broad categories
-    final_state = await run_workflow(
-        categories=["AI Photo/Video", "Productivity", "Health & Fitness", "Games"],
-        mode="general",
-        debug=False,
-    )
+    try:
+        final_state = await run_workflow(
+            categories=["AI Photo/Video", "Productivity", "Health & Fitness", "Games"],
+            mode="general",
+            debug=False,
+        )
+    finally:
+        await aclose_search_http_client()
 
     output = final_state.get("output_to_user", "No output generated.")
     print_markdown(output, title="Daily Alpha")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    runner = uvloop.run if uvloop is not None else asyncio.run
+    runner(main())
@@ -10,25 +10,49 @@ Usage:
 
 Options:
     --parallel    Run categories in parallel (faster but more resource intensive)
-    --sequential  Run categories one at a time (default, safer)
+    --sequential  Run at most 2 categories at a time (default, safer)
     --dry-run     Show what would be run without executing
+    --debug       Show a live progress spinner in sequential mode
 """
 
 import asyncio
+import functools
 import json
 import os
+import string
 import sys
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
 
-from dotenv import load_dotenv
+# uvloop is optional - fall back to the stdlib loop where it isn't installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-# Load environment variables from .env file
-load_dotenv()
+# orjson is optional - both helpers work on bytes so callers don't care which is used
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, indent=2).encode()
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+# Load environment variables from .env file (once per process)
+import _env  # noqa: F401
+
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.panel import Panel
@@ -57,8 +81,8 @@ ALPHY_OUTPUT_DIR = Path(__file__).parent.parent / "alphy"
 def load_gold_standard() -> dict:
     """Load existing gold standard or create new one."""
     if GOLD_STANDARD_PATH.exists():
-        with open(GOLD_STANDARD_PATH) as f:
-            return json.load(f)
+        with open(GOLD_STANDARD_PATH, "rb") as f:
+            return _json_loads(f.read())
     return {
         "version": "1.0",
         "created": datetime.now().strftime("%Y-%m-%d"),
@@ -72,73 +96,93 @@ def load_gold_standard() -> dict:
     }
 
 
-def save_gold_standard(data: dict):
-    """Save gold standard to file."""
-    with open(GOLD_STANDARD_PATH, "w") as f:
-        json.dump(data, f, indent=2)
+async def save_gold_standard(data: dict):
+    """Save gold standard to file without blocking the event loop."""
+    payload = _json_dumps(data)
+    await asyncio.to_thread(GOLD_STANDARD_PATH.write_bytes, payload)
     console.print(f"[green]Saved gold standard to {GOLD_STANDARD_PATH}[/green]")
 
 
+def get_max_run_num(gold_standard: dict) -> int:
+    """Highest numeric suffix among existing run_NNN IDs (0 if none)."""
+    return max(
+        (
+            int(r["id"].split("_", 1)[1])
+            for r in gold_standard.get("runs", [])
+            if r.get("id", "").startswith("run_") and r["id"].split("_", 1)[1].isdigit()
+        ),
+        default=0,
+    )
+
+
 def get_next_run_id(gold_standard: dict) -> str:
     """Generate next run ID."""
-    existing_ids = [r["id"] for r in gold_standard.get("runs", [])]
-    num = 1
-    while f"run_{num:03d}" in existing_ids:
-        num += 1
-    return f"run_{num:03d}"
+    return f"run_{get_max_run_num(gold_standard) + 1:03d}"
+
+
+# Deletes every ASCII char that isn't a lowercase letter, digit, or hyphen
+_SLUG_ALLOWED = set(string.ascii_lowercase + string.digits + "-")
+_SLUG_TRANS = str.maketrans({c: None for c in map(chr, range(128)) if c not in _SLUG_ALLOWED})
 
 
 def category_to_slug(category: str) -> str:
     """Convert category name to filename slug."""
     slug = category.lower().replace(" ", "-").replace("&", "and")
+    # the table only covers ASCII - anything else takes the slow path
+    if slug.isascii():
+        return slug.translate(_SLUG_TRANS)[:25]
     return "".join(c if c.isalnum() or c == "-" else "" for c in slug)[:25]
 
 
+# Blank label scaffold for each app; name/url are filled per app (kept first for key order)
+_LABEL_TEMPLATE = {
+    "name": None,
+    "url": None,
+    "exists": None,
+    "cited": None,
+    "relevant": None,
+    "recent": None,
+    "indie": None,
+    "opportunity_quality": None,
+    "notes": ""
+}
+
+
 def extract_apps_from_json(json_path: Path) -> list:
     """Extract app names and URLs from ALPHY JSON output."""
-    if not json_path.exists():
+    # Cache on (path, mtime, size) so an unchanged file is only parsed once
+    try:
+        stat = json_path.stat()
+    except FileNotFoundError:
         return []
 
+    apps = _extract_apps_cached(str(json_path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    # Hand back fresh dicts - callers fill in the labels in place
+    return [dict(app) for app in apps]
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_apps_cached(json_path: str, mtime_ns: int, size: int) -> tuple:
+    """Parse an ALPHY JSON file into app label skeletons (memoized)."""
     try:
-        with open(json_path) as f:
-            data = json.load(f)
+        with open(json_path, "rb") as f:
+            data = _json_loads(f.read())
+
+        # Prefer discovered_apps, falling back to apps_researched
+        source_apps = data.get("discovered_apps") or data.get("apps_researched") or []
 
         apps = []
+        for app in source_apps:
+            entry = _LABEL_TEMPLATE.copy()
+            entry["name"] = app.get("name", "Unknown")
+            entry["url"] = app.get("source_url") or app.get("url") or None
+            apps.append(entry)
 
-        # Try to extract from discovered_apps
-        if "discovered_apps" in data:
-            for app in data["discovered_apps"]:
-                apps.append({
-                    "name": app.get("name", "Unknown"),
-                    "url": app.get("source_url") or app.get("url") or None,
-                    "exists": None,
-                    "cited": None,
-                    "relevant": None,
-                    "recent": None,
-                    "indie": None,
-                    "opportunity_quality": None,
-                    "notes": ""
-                })
-
-        # Fallback: try apps_researched
-        if not apps and "apps_researched" in data:
-            for app in data["apps_researched"]:
-                apps.append({
-                    "name": app.get("name", "Unknown"),
-                    "url": app.get("source_url") or app.get("url") or None,
-                    "exists": None,
-                    "cited": None,
-                    "relevant": None,
-                    "recent": None,
-                    "indie": None,
-                    "opportunity_quality": None,
-                    "notes": ""
-                })
-
-        return apps
+        return tuple(apps)
     except Exception as e:
         console.print(f"[yellow]Warning: Could not parse {json_path}: {e}[/yellow]")
-        return []
+        return ()
 
 
 async def run_single_category(category: str, progress=None, task_id=None) -> dict:
@@ -146,7 +190,7 @@ async def run_single_category(category: str, progress=None, task_id=None) -> dic
     from workflow.graph import run_workflow
     from cli import save_report
 
-    if progress and task_id:
+    if progress is not None and task_id is not None:
         progress.update(task_id, description=f"[cyan]Running: {category}[/cyan]")
 
     console.print(f"\n[bold blue]Starting: {category}[/bold blue]")
@@ -181,54 +225,77 @@ async def run_single_category(category: str, progress=None, task_id=None) -> dic
             "error": str(e)
         }
     finally:
-        if progress and task_id:
+        if progress is not None and task_id is not None:
             progress.advance(task_id)
 
 
-async def run_all_sequential(categories: list) -> list:
-    """Run all categories sequentially."""
-    results = []
+async def run_all_sequential(categories: list, max_concurrent: int = 2, show_spinner: bool = False) -> list:
+    """Run categories with a small concurrency limit (safer default than --parallel)."""
+    semaphore = asyncio.Semaphore(max_concurrent)
+    total = len(categories)
+    done = 0
+
+    # The spinner redraws on a timer, so only use it when asked for (--debug)
+    progress_ctx = nullcontext()
+    if show_spinner:
+        progress_ctx = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+            refresh_per_second=2,
+        )
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console
-    ) as progress:
-        task = progress.add_task("[cyan]Running evaluations...", total=len(categories))
+    with progress_ctx as progress:
+        task = progress.add_task("[cyan]Running evaluations...", total=total) if progress else None
 
-        for category in categories:
-            result = await run_single_category(category, progress, task)
-            results.append(result)
+        async def run_with_semaphore(category):
+            nonlocal done
+            async with semaphore:
+                result = await run_single_category(category, progress, task)
+            done += 1
+            if progress is None:
+                console.print(f"[{done}/{total}] {category} done")
+            return result
 
-    return results
+        # run_single_category catches its own errors, so one failure won't cancel the group
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(run_with_semaphore(cat)) for cat in categories]
+
+    return [t.result() for t in tasks]
 
 
 async def run_all_parallel(categories: list, max_concurrent: int = 3) -> list:
     """Run categories in parallel with concurrency limit."""
-    semaphore = asyncio.Semaphore(max_concurrent)
-
-    async def run_with_semaphore(category):
-        async with semaphore:
-            return await run_single_category(category)
+    # Let tasks run synchronously until their first real suspension point
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    # Fixed pool of workers draining a queue: only max_concurrent tasks ever exist
+    queue: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
+    for item in enumerate(categories):
+        queue.put_nowait(item)
+
+    processed: list = [None] * len(categories)
+
+    async def worker():
+        while True:
+            try:
+                i, category = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                processed[i] = await run_single_category(category)
+            except Exception as e:
+                processed[i] = {
+                    "success": False,
+                    "category": category,
+                    "error": str(e)
+                }
 
     console.print(f"[bold]Running {len(categories)} categories in parallel (max {max_concurrent} concurrent)[/bold]")
 
-    tasks = [run_with_semaphore(cat) for cat in categories]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Handle any exceptions
-    processed = []
-    for i, result in enumerate(results):
-        if isinstance(result, Exception):
-            processed.append({
-                "success": False,
-                "category": categories[i],
-                "error": str(result)
-            })
-        else:
-            processed.append(result)
+    await asyncio.gather(*(worker() for _ in range(min(max_concurrent, len(categories)))))
 
     return processed
 
@@ -237,6 +304,9 @@ def create_gold_standard_entries(results: list, gold_standard: dict) -> dict:
     """Create gold standard entries from run results."""
     today = datetime.now().strftime("%Y-%m-%d")
 
+    # Scan existing IDs once, then hand out sequential numbers
+    run_num = get_max_run_num(gold_standard)
+
     for result in results:
         if not result.get("success"):
             continue
@@ -245,12 +315,11 @@ def create_gold_standard_entries(results: list, gold_standard: dict) -> dict:
         json_path = result.get("json_path", "")
         md_path = result.get("md_path", "")
 
-        # Extract apps from JSON output
-        apps = []
-        if json_path and Path(json_path).exists():
-            apps = extract_apps_from_json(Path(json_path))
+        # Extract apps from JSON output (missing files come back as [])
+        apps = extract_apps_from_json(Path(json_path)) if json_path else []
 
-        run_id = get_next_run_id(gold_standard)
+        run_num += 1
+        run_id = f"run_{run_num:03d}"
 
         entry = {
             "id": run_id,
@@ -298,13 +367,36 @@ def print_summary(results: list):
     console.print(f"\n[bold]Completed: {success_count}/{len(results)} categories[/bold]")
 
 
+async def run_evaluations(categories: list, gold_standard: dict, args) -> list:
+    """Run all categories, then record and save their gold standard entries."""
+    from agents.tools import aclose_search_http_client
+
+    try:
+        if args.parallel:
+            results = await run_all_parallel(categories, args.max_concurrent)
+        else:
+            results = await run_all_sequential(categories, show_spinner=args.debug)
+    finally:
+        # one search client is shared by every run on this loop - close it once at the end
+        await aclose_search_http_client()
+
+    # Create gold standard entries
+    gold_standard = create_gold_standard_entries(results, gold_standard)
+
+    # Save gold standard
+    await save_gold_standard(gold_standard)
+
+    return results
+
+
 def main():
     import argparse
 
     parser = argparse.ArgumentParser(description="Run gold standard evaluations")
     parser.add_argument("--parallel", action="store_true", help="Run categories in parallel")
-    parser.add_argument("--sequential", action="store_true", help="Run categories sequentially (default)")
+    parser.add_argument("--sequential", action="store_true", help="Run at most 2 categories at a time (default)")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be run")
+    parser.add_argument("--debug", action="store_true", help="Show a live progress spinner (sequential mode)")
     parser.add_argument("--max-concurrent", type=int, default=3, help="Max concurrent runs (for parallel mode)")
     parser.add_argument("--categories", type=str, help="Comma-separated list of specific categories to run")
 
@@ -334,17 +426,9 @@ def main():
     # Load existing gold standard
     gold_standard = load_gold_standard()
 
-    # Run evaluations
-    if args.parallel:
-        results = asyncio.run(run_all_parallel(categories, args.max_concurrent))
-    else:
-        results = asyncio.run(run_all_sequential(categories))
-
-    # Create gold standard entries
-    gold_standard = create_gold_standard_entries(results, gold_standard)
-
-    # Save gold standard
-    save_gold_standard(gold_standard)
+    # Run evaluations and save entries on a single event loop
+    runner = uvloop.run if uvloop is not None else asyncio.run
+    results = runner(run_evaluations(categories, gold_standard, args))
 
     # Print summary
     print_summary(results)
@@ -6,11 +6,20 @@ Uses MCP client to communicate with the server
 
 import asyncio
 import os
-import json
-from dotenv import load_dotenv
+import sys
+from pathlib import Path
 
-# Load environment variables
-load_dotenv()
+# uvloop is optional - fall back to the stdlib loop where it isn't installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Project root (not src/) on the path - src/mcp would shadow the mcp package
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Load environment variables (once per process)
+import src._env  # noqa: F401
 
 # Check token
 token = os.getenv("PRODUCT_HUNT_TOKEN")
@@ -22,6 +31,116 @@ print("✅ PRODUCT_HUNT_TOKEN found\n")
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
+from pydantic import BaseModel, Field, model_validator
+
+
+# --- Typed tool responses ---
+# Decoded in one pass by pydantic's JSON parser instead of json.loads + chains
+# of dict.get(). Every field has a default so partial responses still validate.
+
+class _Node(BaseModel):
+    """List item that may arrive wrapped as {"node": {...}}."""
+
+    @model_validator(mode="before")
+    @classmethod
+    def _unwrap_node(cls, value):
+        if isinstance(value, dict) and "node" in value:
+            return value["node"]
+        return value
+
+
+class Maker(BaseModel):
+    name: str | None = "?"
+    username: str | None = "?"
+
+
+class Post(_Node):
+    name: str | None = "Unknown"
+    tagline: str | None = "N/A"
+    slug: str | None = None
+    description: str | None = "N/A"
+    votesCount: int | None = 0
+    commentsCount: int | None = 0
+    website: str | None = "N/A"
+    makers: list[Maker] = Field(default_factory=list)
+
+
+class Topic(_Node):
+    name: str | None = "Unknown"
+    slug: str | None = "N/A"
+    followersCount: int | None = 0
+
+
+class Collection(_Node):
+    name: str | None = "Unknown"
+    followersCount: int | None = 0
+
+
+class RateLimits(BaseModel):
+    remaining: int | str | None = "?"
+    limit: int | str | None = "?"
+
+
+class ServerStatus(BaseModel):
+    status: str | None = "unknown"
+    authenticated: bool | None = False
+    rate_limits: RateLimits | None = None
+
+
+class Payload(BaseModel):
+    posts: list[Post] = Field(default_factory=list)
+    post: Post | None = None
+    topics: list[Topic] = Field(default_factory=list)
+    collections: list[Collection] = Field(default_factory=list)
+
+
+class ToolResponse(Payload):
+    """Either {"success": ..., "data": {...}} or the bare payload."""
+    data: Payload | None = None
+
+    @property
+    def payload(self) -> Payload:
+        return self.data if self.data is not None else self
+
+
+def _decode(result) -> Payload:
+    """Decode a call_tool result straight into a typed payload."""
+    content = result.content[0].text if result.content else "{}"
+    return ToolResponse.model_validate_json(content).payload
+
+
+def _unwrap(result):
+    """Re-raise an exception captured by asyncio.gather(return_exceptions=True)."""
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+def _first_post_slug(posts_result) -> str | None:
+    """Pull the first post's slug out of a get_posts result."""
+    posts = _decode(posts_result).posts
+    return posts[0].slug if posts else None
+
+
+async def _fetch_post_details(session: ClientSession, featured_posts: asyncio.Future):
+    """Fetch details for a featured post (Test 5), reusing Test 2's slug when possible."""
+    try:
+        slug = _first_post_slug(await featured_posts)
+    except Exception:
+        slug = None
+
+    if not slug:
+        # Test 2 came back empty - look up a featured post ourselves
+        posts_result = await session.call_tool("get_posts", {"featured": True, "count": 1})
+        slug = _first_post_slug(posts_result)
+        if not slug:
+            return None, None
+
+    result = await session.call_tool("get_post_details", {
+        "slug": slug,
+        "comments_count": 3
+    })
+    return slug, result
 
 
 async def test_product_hunt_mcp():
@@ -42,6 +161,9 @@ async def test_product_hunt_mcp():
 
     async with stdio_client(server_params) as (read, write):
         async with ClientSession(read, write) as session:
+            # Run short MCP calls inline until they actually need to wait
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
             # Initialize the session
             await session.initialize()
 
@@ -53,19 +175,53 @@ async def test_product_hunt_mcp():
                 print(f"  • {tool.name}")
             print()
 
+            # Test 5 only depends on Test 2's featured posts (for a slug), so
+            # issue every MCP call at once and report on the results in order below
+            featured_posts = asyncio.ensure_future(session.call_tool("get_posts", {
+                "featured": True,
+                "count": 5,
+                "order": "VOTES"
+            }))
+
+            (
+                status_res,
+                featured_res,
+                topic_res,
+                topics_res,
+                details_res,
+                collections_res,
+            ) = await asyncio.gather(
+                session.call_tool("check_server_status", {}),
+                featured_posts,
+                session.call_tool("get_posts", {
+                    "topic": "artificial-intelligence",
+                    "count": 5
+                }),
+                session.call_tool("search_topics", {
+                    "query": "productivity",
+                    "count": 5
+                }),
+                _fetch_post_details(session, featured_posts),
+                session.call_tool("get_collections", {
+                    "featured": True,
+                    "count": 5
+                }),
+                return_exceptions=True,
+            )
+
             # Test 1: Check server status
             print("\n📡 TEST 1: Server Status")
             print("─" * 40)
             try:
-                result = await session.call_tool("check_server_status", {})
+                result = _unwrap(status_res)
                 content = result.content[0].text if result.content else "No content"
-                data = json.loads(content)
-                print(f"  Status: {data.get('status', 'unknown')}")
-                print(f"  Authenticated: {data.get('authenticated', False)}")
-                if data.get('rate_limits'):
-                    limits = data['rate_limits']
-                    print(f"  Rate Limits: {limits.get('remaining', '?')}/{limits.get('limit', '?')}")
-                results["Server Status"] = data.get('authenticated', False)
+                data = ServerStatus.model_validate_json(content)
+                print(f"  Status: {data.status}")
+                print(f"  Authenticated: {data.authenticated}")
+                if data.rate_limits:
+                    limits = data.rate_limits
+                    print(f"  Rate Limits: {limits.remaining}/{limits.limit}")
+                results["Server Status"] = bool(data.authenticated)
             except Exception as e:
                 print(f"  Error: {e}")
                 results["Server Status"] = False
@@ -74,24 +230,15 @@ async def test_product_hunt_mcp():
             print("\n📱 TEST 2: Get Featured Posts")
             print("─" * 40)
             try:
-                result = await session.call_tool("get_posts", {
-                    "featured": True,
-                    "count": 5,
-                    "order": "VOTES"
-                })
-                content = result.content[0].text if result.content else "{}"
-                data = json.loads(content)
-
-                # Handle nested response: {"success": true, "data": {"posts": [...]}}
-                posts_data = data.get("data", data)
-                if posts_data.get("posts"):
-                    posts = [p.get("node", p) for p in posts_data["posts"]]
+                # Handles nested response: {"success": true, "data": {"posts": [...]}}
+                posts = _decode(_unwrap(featured_res)).posts
+                if posts:
                     print(f"  Found {len(posts)} featured posts:\n")
                     for post in posts[:5]:
-                        print(f"  • {post.get('name', 'Unknown')}")
-                        tagline = post.get('tagline', 'N/A') or 'N/A'
+                        print(f"  • {post.name}")
+                        tagline = post.tagline or 'N/A'
                         print(f"    {tagline[:60]}")
-                        print(f"    Votes: {post.get('votesCount', 0)}")
+                        print(f"    Votes: {post.votesCount}")
                         print()
                     results["Get Featured Posts"] = True
                 else:
@@ -105,26 +252,17 @@ async def test_product_hunt_mcp():
             print("\n🏷️ TEST 3: Get Posts by Topic (AI)")
             print("─" * 40)
             try:
-                result = await session.call_tool("get_posts", {
-                    "topic": "artificial-intelligence",
-                    "count": 5
-                })
-                content = result.content[0].text if result.content else "{}"
-                data = json.loads(content)
-
-                posts_data = data.get("data", data)
-                if posts_data.get("posts"):
-                    posts = [p.get("node", p) for p in posts_data["posts"]]
+                posts = _decode(_unwrap(topic_res)).posts
+                if posts:
                     print(f"  Found {len(posts)} AI-related posts:\n")
                     for post in posts[:5]:
-                        print(f"  • {post.get('name', 'Unknown')}")
-                        tagline = post.get('tagline', 'N/A') or 'N/A'
+                        print(f"  • {post.name}")
+                        tagline = post.tagline or 'N/A'
                         print(f"    {tagline[:50]}..." if len(tagline) > 50 else f"    {tagline}")
-                        print(f"    Votes: {post.get('votesCount', 0)}")
+                        print(f"    Votes: {post.votesCount}")
                         # Check for makers (indie indicator)
-                        makers = post.get('makers', [])
-                        if makers:
-                            maker_names = [m.get('name', '?') for m in makers[:2]]
+                        if post.makers:
+                            maker_names = [m.name or '?' for m in post.makers[:2]]
                             print(f"    Makers: {', '.join(maker_names)}")
                         print()
                     results["Get Posts by Topic"] = True
@@ -139,20 +277,12 @@ async def test_product_hunt_mcp():
             print("\n🔍 TEST 4: Search Topics")
             print("─" * 40)
             try:
-                result = await session.call_tool("search_topics", {
-                    "query": "productivity",
-                    "count": 5
-                })
-                content = result.content[0].text if result.content else "{}"
-                data = json.loads(content)
-
-                topics_data = data.get("data", data)
-                if topics_data.get("topics"):
-                    topics = [t.get("node", t) for t in topics_data["topics"]]
+                topics = _decode(_unwrap(topics_res)).topics
+                if topics:
                     print(f"  Found {len(topics)} topics matching 'productivity':\n")
                     for topic in topics[:5]:
-                        print(f"  • {topic.get('name', 'Unknown')} (slug: {topic.get('slug', 'N/A')})")
-                        print(f"    Followers: {topic.get('followersCount', 0)}")
+                        print(f"  • {topic.name} (slug: {topic.slug})")
+                        print(f"    Followers: {topic.followersCount}")
                     results["Search Topics"] = True
                 else:
                     print(f"  No topics found")
@@ -165,41 +295,26 @@ async def test_product_hunt_mcp():
             print("\n📋 TEST 5: Get Post Details")
             print("─" * 40)
             try:
-                # First get a post slug
-                posts_result = await session.call_tool("get_posts", {"featured": True, "count": 1})
-                posts_raw = json.loads(posts_result.content[0].text)
-                posts_data = posts_raw.get("data", posts_raw)
-
-                if posts_data.get("posts"):
-                    first_post = posts_data["posts"][0]
-                    post_node = first_post.get("node", first_post)
-                    slug = post_node.get("slug")
+                slug, result = _unwrap(details_res)
+
+                if result is not None:
                     print(f"  Looking up: {slug}\n")
 
-                    result = await session.call_tool("get_post_details", {
-                        "slug": slug,
-                        "comments_count": 3
-                    })
-                    content = result.content[0].text if result.content else "{}"
-                    data = json.loads(content)
-                    post_data = data.get("data", data)
-
-                    if post_data.get("post"):
-                        post = post_data["post"]
-                        print(f"  Name: {post.get('name', 'Unknown')}")
-                        print(f"  Tagline: {post.get('tagline', 'N/A')}")
-                        desc = post.get('description', 'N/A') or 'N/A'
+                    post = _decode(result).post
+                    if post:
+                        print(f"  Name: {post.name}")
+                        print(f"  Tagline: {post.tagline}")
+                        desc = post.description or 'N/A'
                         print(f"  Description: {desc[:100]}...")
-                        print(f"  Votes: {post.get('votesCount', 0)}")
-                        print(f"  Comments: {post.get('commentsCount', 0)}")
-                        print(f"  Website: {post.get('website', 'N/A')}")
+                        print(f"  Votes: {post.votesCount}")
+                        print(f"  Comments: {post.commentsCount}")
+                        print(f"  Website: {post.website}")
 
                         # Makers info (indie detection)
-                        makers = post.get('makers', [])
-                        if makers:
-                            print(f"\n  Makers ({len(makers)}):")
-                            for maker in makers[:3]:
-                                print(f"    - {maker.get('name', '?')} (@{maker.get('username', '?')})")
+                        if post.makers:
+                            print(f"\n  Makers ({len(post.makers)}):")
+                            for maker in post.makers[:3]:
+                                print(f"    - {maker.name} (@{maker.username})")
 
                         results["Get Post Details"] = True
                     else:
@@ -216,20 +331,12 @@ async def test_product_hunt_mcp():
             print("\n📚 TEST 6: Get Collections")
             print("─" * 40)
             try:
-                result = await session.call_tool("get_collections", {
-                    "featured": True,
-                    "count": 5
-                })
-                content = result.content[0].text if result.content else "{}"
-                data = json.loads(content)
-                coll_data = data.get("data", data)
-
-                if coll_data.get("collections"):
-                    collections = [c.get("node", c) for c in coll_data["collections"]]
+                collections = _decode(_unwrap(collections_res)).collections
+                if collections:
                     print(f"  Found {len(collections)} featured collections:\n")
                     for coll in collections[:5]:
-                        print(f"  • {coll.get('name', 'Unknown')}")
-                        print(f"    Followers: {coll.get('followersCount', 0)}")
+                        print(f"  • {coll.name}")
+                        print(f"    Followers: {coll.followersCount}")
                     results["Get Collections"] = True
                 else:
                     print(f"  No collections found")
@@ -254,4 +361,5 @@ async def test_product_hunt_mcp():
 
 
 if __name__ == "__main__":
-    asyncio.run(test_product_hunt_mcp())
+    runner = uvloop.run if uvloop is not None else asyncio.run
+    runner(test_product_hunt_mcp())
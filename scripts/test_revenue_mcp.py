@@ -7,6 +7,12 @@ import asyncio
 import json
 import httpx
 
+# uvloop is optional - fall back to the stdlib loop where it isn't installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Smithery MCP endpoint
 MCP_URL = "https://server.smithery.ai/@kemalersin/app-revenue-mcp/mcp"
 
@@ -38,40 +44,67 @@ async def discover_tools():
                 }
             }
 
-            print("📡 Sending initialize request...")
+            # MCP tools/list request
+            list_tools_payload = {
+                "jsonrpc": "2.0",
+                "id": 2,
+                "method": "tools/list",
+                "params": {}
+            }
+
+            # JSON-RPC 2.0 batch: both requests share one round-trip
+            print("📡 Sending initialize + tools/list batch request...")
             response = await client.post(
                 MCP_URL,
-                json=init_payload,
+                json=[init_payload, list_tools_payload],
                 headers={"Content-Type": "application/json"}
             )
 
             print(f"Status: {response.status_code}")
 
+            batch = None
             if response.status_code == 200:
-                data = response.json()
-                print(f"Response: {json.dumps(data, indent=2)[:500]}")
-
-                # Now list tools
-                list_tools_payload = {
-                    "jsonrpc": "2.0",
-                    "id": 2,
-                    "method": "tools/list",
-                    "params": {}
-                }
-
-                print("\n📋 Listing tools...")
-                tools_response = await client.post(
+                try:
+                    batch = response.json()
+                except ValueError:
+                    batch = None
+
+            if isinstance(batch, list):
+                responses = {r.get("id"): r for r in batch}
+                init_data = responses.get(1, {})
+                tools_data = responses.get(2, {})
+                print(f"Response: {json.dumps(init_data, indent=2)[:500]}")
+                print(f"\nTools Response:\n{json.dumps(tools_data, indent=2)}")
+
+            elif response.status_code in (200, 400):
+                # Server doesn't accept batches - fall back to one request at a time
+                print("Batch not supported, sending requests individually...")
+                init_response = await client.post(
                     MCP_URL,
-                    json=list_tools_payload,
+                    json=init_payload,
                     headers={"Content-Type": "application/json"}
                 )
-
-                if tools_response.status_code == 200:
-                    tools_data = tools_response.json()
-                    print(f"\nTools Response:\n{json.dumps(tools_data, indent=2)}")
+                print(f"Status: {init_response.status_code}")
+
+                if init_response.status_code == 200:
+                    data = init_response.json()
+                    print(f"Response: {json.dumps(data, indent=2)[:500]}")
+
+                    print("\n📋 Listing tools...")
+                    tools_response = await client.post(
+                        MCP_URL,
+                        json=list_tools_payload,
+                        headers={"Content-Type": "application/json"}
+                    )
+
+                    if tools_response.status_code == 200:
+                        tools_data = tools_response.json()
+                        print(f"\nTools Response:\n{json.dumps(tools_data, indent=2)}")
+                    else:
+                        print(f"Tools request failed: {tools_response.status_code}")
+                        print(tools_response.text[:500])
                 else:
-                    print(f"Tools request failed: {tools_response.status_code}")
-                    print(tools_response.text[:500])
+                    print(f"Response body: {init_response.text[:500]}")
 
             else:
                 print(f"Response body: {response.text[:500]}")
@@ -96,4 +129,5 @@ async def discover_tools():
 
 
 if __name__ == "__main__":
-    asyncio.run(discover_tools())
+    runner = uvloop.run if uvloop is not None else asyncio.run
+    runner(discover_tools())
@@ -0,0 +1,16 @@
+# -----------------------------------------------------------------------------
+# Environment Loading
+#
+# Loads .env exactly once per process. Entry points import this module instead
+# of calling load_dotenv() themselves, so repeat imports are a sys.modules hit.
+# Subprocesses (e.g. MCP servers) should get the resolved vars via env= rather
+# than re-parsing .env.
+#
+# Usage:
+#   import _env  # noqa: F401
+# -----------------------------------------------------------------------------
+
+from dotenv import load_dotenv
+
+# True if a .env file was found and loaded
+ENV_LOADED = load_dotenv()
@@ -9,27 +9,44 @@
 #   from agents.base import Agent, AgentResponse
 # -----------------------------------------------------------------------------
 
-from agents.base import (
-    Agent,
-    AgentResponse,
-    create_llm,
-    logger,
-    setup_logger,
-    print_markdown,
-    extract_text_content,
-)
-
-# New deep research agents
-from agents.planner import PlannerAgent
-from agents.discovery import DiscoveryResearcherAgent
-from agents.deep_research import DeepResearcherAgent
-from agents.reflection import ReflectionAgent
-from agents.pattern_extraction import PatternExtractorAgent
-from agents.synthesis import SynthesisAgent
-
-# Legacy agents
-from agents.trend_research import TrendResearchAgent
-from agents.user_communicator import UserCommunicatorAgent
+import importlib
+
+# Exports are resolved lazily (PEP 562) so importing the package doesn't pull in
+# every agent module and its LLM client dependencies up front.
+_LAZY_IMPORTS = {
+    # Base classes
+    "Agent": "agents.base",
+    "AgentResponse": "agents.base",
+    "create_llm": "agents.base",
+    "logger": "agents.base",
+    "setup_logger": "agents.base",
+    "print_markdown": "agents.base",
+    "extract_text_content": "agents.base",
+    # New deep research agents
+    "PlannerAgent": "agents.planner",
+    "DiscoveryResearcherAgent": "agents.discovery",
+    "DeepResearcherAgent": "agents.deep_research",
+    "ReflectionAgent": "agents.reflection",
+    "PatternExtractorAgent": "agents.pattern_extraction",
+    "SynthesisAgent": "agents.synthesis",
+    # Legacy agents
+    "TrendResearchAgent": "agents.trend_research",
+    "UserCommunicatorAgent": "agents.user_communicator",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # cache so __getattr__ isn't hit again
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Base classes
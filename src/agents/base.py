@@ -1,10 +1,18 @@
 import os
 import logging
+import threading
 from typing import List, Optional, Any, Callable, Union
 from dataclasses import dataclass
 from langchain_core.messages import SystemMessage, HumanMessage, BaseMessage
 from langchain_core.language_models import BaseChatModel
-from config.settings import get_model_id, get_provider, VERTEX_PROJECT_ID, VERTEX_REGION
+from config.settings import (
+    get_model_id,
+    get_provider,
+    GEMINI_VERTEX_REGION,
+    VERTEX_PROJECT_ID,
+    VERTEX_REGION,
+)
+from agents.llm_cache import cached_ainvoke
 
 # -----------------------------------------------------------------------------
 # Logger Setup
@@ -12,15 +20,20 @@ from config.settings import get_model_id, get_provider, VERTEX_PROJECT_ID, VERTE
 # Simple logger that outputs to stdout with timestamps.
 # Usage: logger.info("message"), logger.debug("message"), etc.
 # -----------------------------------------------------------------------------
+# names of loggers setup_logger() has already configured
+_configured_loggers: set[str] = set()
+
+
 def setup_logger(name: str = "agents", level: int = logging.INFO) -> logging.Logger:
     logger = logging.getLogger(name)
+    logger.propagate = False  # prevent duplicate logs from root logger
 
     # avoid adding handlers multiple times
-    if logger.handlers:
+    if name in _configured_loggers:
         return logger
+    _configured_loggers.add(name)
 
     logger.setLevel(level)
-    logger.propagate = False  # prevent duplicate logs from root logger
 
     # create stdout handler
     handler = logging.StreamHandler()
@@ -92,26 +105,48 @@ def extract_text_content(content) -> str:
     Extract plain text from LLM response content.
     Handles both string responses and structured content blocks.
     """
+    # exact type checks - content is always a plain str/list, and this
+    # runs on every LLM response
+    content_type = type(content)
+
     # if it's already a string, return it
-    if isinstance(content, str):
+    if content_type is str:
         return content
 
     # if it's a list of content blocks, extract text from each
-    if isinstance(content, list):
+    if content_type is list:
+        # fast path: a single block (the usual Claude/Gemini shape)
+        if len(content) == 1:
+            block = content[0]
+            if type(block) is dict:
+                return block.get("text") or ""
+            if type(block) is str:
+                return block
+
         text_parts = []
+        append = text_parts.append
         for block in content:
-            if isinstance(block, dict):
-                # get 'text' field from structured block
-                if "text" in block:
-                    text_parts.append(block["text"])
-            elif isinstance(block, str):
-                text_parts.append(block)
+            if type(block) is dict:
+                # get 'text' field from structured block (one lookup)
+                text = block.get("text")
+                if text is not None:
+                    append(text)
+            elif type(block) is str:
+                append(block)
+
+        if len(text_parts) == 1:
+            return text_parts[0]
         return "\n".join(text_parts)
 
     # fallback: convert to string
     return str(content) if content else ""
 
 
+def _preview(text: str, limit: int = 100) -> str:
+    """Truncate text for log lines, marking the cut with '...'."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
 # -----------------------------------------------------------------------------
 # Response object returned by Agent.run()
 # Contains everything the node needs to update state
@@ -129,9 +164,53 @@ class AgentResponse:
 #
 # Supports multiple providers:
 #   - "vertex": Claude on Vertex AI (default)
-#   - "gemini": Google Gemini
+#   - "gemini_vertex": Gemini on Vertex AI (GCP billing + credentials)
+#   - "gemini": Google Gemini via an AI Studio API key
 # -----------------------------------------------------------------------------
 _llm_banner_shown = False
+_llm_banner_lock = threading.Lock()
+
+
+def _show_llm_banner(provider: str, model_id: str):
+    """Print provider info once per process, even if agents are built from several threads."""
+    global _llm_banner_shown
+    if _llm_banner_shown:
+        return
+    with _llm_banner_lock:
+        if _llm_banner_shown:
+            return
+        _llm_banner_shown = True
+
+    lines = [
+        "",
+        "=" * 60,
+        f"🤖 LLM PROVIDER: {provider.upper()}",
+        f"📦 MODEL: {model_id}",
+    ]
+    if provider == "vertex":
+        lines.append(f"🌍 REGION: {VERTEX_REGION}")
+        lines.append(f"📁 PROJECT: {VERTEX_PROJECT_ID}")
+    elif provider == "gemini_vertex":
+        lines.append(f"🌍 REGION: {GEMINI_VERTEX_REGION}")
+        lines.append(f"📁 PROJECT: {VERTEX_PROJECT_ID}")
+    lines.append("=" * 60)
+    # one write instead of one per line
+    print("\n".join(lines) + "\n")
+
+
+# Built clients keyed by (provider, model_id, tool names) - agents with the
+# same model + tools share one client instead of rebuilding it (and its
+# tool schemas) per instance.
+_llm_cache: dict[tuple, BaseChatModel] = {}
+
+
+def _tools_key(tools: Optional[List[Callable]]) -> tuple:
+    """Stable cache key for a tool list (tool names, order-insensitive)."""
+    return tuple(sorted(
+        getattr(t, "name", None) or getattr(t, "__qualname__", repr(t))
+        for t in tools or ()
+    ))
+
 
 def create_llm(
     model: str = "claude-opus",
@@ -139,6 +218,8 @@ def create_llm(
 ) -> BaseChatModel:
     """
     Create an LLM client based on the configured provider.
+    Clients are cached, so repeat calls with the same model + tools
+    return the same instance.
 
     Args:
         model: Model name (will be mapped to actual model ID)
@@ -147,21 +228,18 @@ def create_llm(
     Returns:
         LangChain chat model instance
     """
-    global _llm_banner_shown
     provider = get_provider()
     model_id = get_model_id(model)
 
+    cache_key = (provider, model_id, _tools_key(tools))
+    cached = _llm_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     # Show provider info once at startup
-    if not _llm_banner_shown:
-        print(f"\n{'='*60}")
-        print(f"🤖 LLM PROVIDER: {provider.upper()}")
-        print(f"📦 MODEL: {model_id}")
-        if provider == "vertex":
-            print(f"🌍 REGION: {VERTEX_REGION}")
-            print(f"📁 PROJECT: {VERTEX_PROJECT_ID}")
-        print(f"{'='*60}\n")
-        _llm_banner_shown = True
+    _show_llm_banner(provider, model_id)
 
+    # provider SDKs are imported here so only the one in use is loaded
     if provider == "vertex":
         # Claude on Vertex AI (via Google's Model Garden)
         from langchain_google_vertexai.model_garden import ChatAnthropicVertex
@@ -171,6 +249,15 @@ def create_llm(
             project=VERTEX_PROJECT_ID,
             location=VERTEX_REGION,
         )
+    elif provider == "gemini_vertex":
+        # Gemini on Vertex AI - billed through GCP, no API key
+        from langchain_google_vertexai import ChatVertexAI
+
+        llm = ChatVertexAI(
+            model_name=model_id,
+            project=VERTEX_PROJECT_ID,
+            location=GEMINI_VERTEX_REGION,
+        )
     else:
         # Google Gemini (fallback)
         from langchain_google_genai import ChatGoogleGenerativeAI
@@ -183,9 +270,55 @@ def create_llm(
     if tools:
         llm = llm.bind_tools(tools)
 
+    _llm_cache[cache_key] = llm
     return llm
 
 
+# -----------------------------------------------------------------------------
+# System prompts + prompt caching
+#
+# The static instructions always come first and the dynamic context (today's
+# date) last, so the prefix stays identical across calls and days. On Vertex
+# (Claude) the instructions are their own content block marked with
+# cache_control, so the tools + instructions prefix is billed at the cache-read
+# rate on every turn after the first; the context is a second, uncached block.
+# Gemini caches long shared prefixes implicitly; nothing to mark there.
+# -----------------------------------------------------------------------------
+PROMPT_CONTEXT_HEADER = "\n\nCONTEXT:\n"
+
+
+def build_system_message(prompt: str, context: Optional[str] = None) -> SystemMessage:
+    """Build a system message, marking the static prompt for prompt caching."""
+    prompt = prompt.rstrip()
+    if get_provider() != "vertex":
+        if context:
+            prompt = f"{prompt}{PROMPT_CONTEXT_HEADER}{context}"
+        return SystemMessage(content=prompt)
+
+    blocks = [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]
+    if context:
+        blocks.append({"type": "text", "text": f"CONTEXT:\n{context}"})
+    return SystemMessage(content=blocks)
+
+
+def log_cache_usage(name: str, response: BaseMessage) -> None:
+    """Debug-log prompt cache reads/writes reported for a live LLM call."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    usage = getattr(response, "usage_metadata", None)
+    if not usage:
+        # replayed from the LLM cache, or the provider doesn't report usage
+        return
+    details = usage.get("input_token_details") or {}
+    logger.debug(
+        "[%s] input tokens: %s (cache read: %s, cache write: %s)",
+        name,
+        usage.get("input_tokens"),
+        details.get("cache_read", 0),
+        details.get("cache_creation", 0),
+    )
+
+
 # -----------------------------------------------------------------------------
 # Agent Base Class
 #
@@ -197,15 +330,29 @@ def create_llm(
 # Nodes become thin orchestration layers that just call agent.run()
 # -----------------------------------------------------------------------------
 class Agent:
+    # opt into the semantic LLM cache tier (see agents.llm_cache)
+    semantic_cache: bool = False
+
     def __init__(self, config: Any):
         """
         Initialize agent with config.
-        Config should have: model, tools, system_prompt, name
+        Config should have: model, tools, system_prompt, name, context()
         """
         self.config = config
         self.name = config.name
         self.llm = create_llm(config.model, config.tools)
-        logger.debug(f"[{self.name}] initialized with model: {config.model}")
+        # built on first use (and again when the context changes, e.g. a new
+        # day) - _system_message() hands out unvalidated copies
+        self._system_msg: Optional[SystemMessage] = None
+        self._system_context: Optional[str] = None
+        # everything besides the messages that changes the response (for the LLM cache)
+        self.cache_key_extra = (
+            get_provider(),
+            get_model_id(config.model),
+            self.name,
+            _tools_key(config.tools),
+        )
+        logger.debug("[%s] initialized with model: %s", self.name, config.model)
 
     async def run(
         self,
@@ -232,12 +379,12 @@ class Agent:
         """
         # check if this is first call or continuation
         existing_messages = state.get(messages_key, [])
-        is_first_call = len(existing_messages) == 0
+        is_first_call = not existing_messages
 
         if is_first_call:
-            logger.info(f"[{self.name}] starting (first call)")
+            logger.info("[%s] starting (first call)", self.name)
         else:
-            logger.info(f"[{self.name}] continuing (message count: {len(existing_messages)})")
+            logger.info("[%s] continuing (message count: %d)", self.name, len(existing_messages))
 
         # build messages based on whether first call or not
         if is_first_call:
@@ -246,29 +393,36 @@ class Agent:
             messages = existing_messages
 
         # call the LLM
-        response = await self.llm.ainvoke(messages)
+        response = await cached_ainvoke(
+            self.llm, messages, key_extra=self.cache_key_extra, semantic=self.semantic_cache
+        )
+        log_cache_usage(self.name, response)
 
         # build the new message list
         if is_first_call:
-            new_messages = messages + [response]
+            # messages is a fresh list from _build_initial_messages - extend in place
+            messages.append(response)
+            new_messages = messages
         else:
             # just the response - state has a reducer that will append
             new_messages = [response]
 
         # check for tool calls
-        has_tool_calls = False
-        if hasattr(response, "tool_calls") and response.tool_calls:
-            has_tool_calls = True
-            tool_names = [tc.get("name", "unknown") for tc in response.tool_calls]
-            logger.info(f"[{self.name}] requesting tools: {tool_names}")
+        tool_calls = getattr(response, "tool_calls", None)
+        has_tool_calls = bool(tool_calls)
+        if has_tool_calls and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[%s] requesting tools: %s",
+                self.name,
+                ", ".join(tc.get("name", "unknown") for tc in tool_calls),
+            )
 
         # get content (might be empty string if tool call)
         content = extract_text_content(response.content)
 
-        if not has_tool_calls:
-            # truncate content for logging
-            preview = content[:100] + "..." if len(content) > 100 else content
-            logger.info(f"[{self.name}] completed with response: {preview}")
+        # truncate content for logging (skipped entirely below INFO)
+        if not has_tool_calls and logger.isEnabledFor(logging.INFO):
+            logger.info("[%s] completed with response: %s", self.name, _preview(content))
 
         return AgentResponse(
             messages=new_messages,
@@ -281,16 +435,30 @@ class Agent:
         """
         Build the initial message list for first call.
         Includes system prompt and user input.
+        Returns a new list the caller owns (run() appends the response to it).
         """
         user_input = state.get(input_key, "")
 
         messages = [
-            SystemMessage(content=self.config.system_prompt),
+            self._system_message(),
             HumanMessage(content=user_input),
         ]
 
         return messages
 
+    def _system_message(self) -> SystemMessage:
+        """
+        The agent's system prompt as a message.
+        Copies the prebuilt message (model_copy skips pydantic validation)
+        rather than sharing it, since the add_messages reducer assigns ids
+        to messages in place.
+        """
+        context = self.config.context()
+        if self._system_msg is None or context != self._system_context:
+            self._system_msg = build_system_message(self.config.system_prompt, context)
+            self._system_context = context
+        return self._system_msg.model_copy()
+
     async def run_simple(
         self,
         input_text: str,
@@ -307,31 +475,49 @@ class Agent:
         Returns:
             AgentResponse with the result
         """
-        logger.info(f"[{self.name}] run_simple called")
+        logger.info("[%s] run_simple called", self.name)
 
-        system_prompt = system_prompt_override or self.config.system_prompt
+        if system_prompt_override:
+            system_message = build_system_message(system_prompt_override)
+        else:
+            system_message = self._system_message()
 
-        messages = [
-            SystemMessage(content=system_prompt),
+        return await self._ainvoke([
+            system_message,
             HumanMessage(content=input_text),
-        ]
+        ])
+
+    async def _ainvoke(self, messages: List[BaseMessage]) -> AgentResponse:
+        """
+        One-shot LLM call on prebuilt messages (the body of run_simple).
+        For callers that build their own messages around the cached
+        self._system_message() (e.g. PatternExtractorAgent.extract_patterns).
+        Takes ownership of messages: the response is appended to it.
 
-        logger.debug(f"[{self.name}] calling LLM...")
-        response = await self.llm.ainvoke(messages)
+        Args:
+            messages: Full message list to send
 
+        Returns:
+            AgentResponse with the result
+        """
+        logger.debug("[%s] calling LLM...", self.name)
+        response = await cached_ainvoke(
+            self.llm, messages, key_extra=self.cache_key_extra, semantic=self.semantic_cache
+        )
+        log_cache_usage(self.name, response)
 
-        has_tool_calls = False
-        if hasattr(response, "tool_calls") and response.tool_calls:
-            has_tool_calls = True
+        has_tool_calls = bool(getattr(response, "tool_calls", None))
 
         # use helper to extract text from structured content blocks
         content = extract_text_content(response.content)
 
-        preview = content[:100] + "..." if len(content) > 100 else content
-        logger.info(f"[{self.name}] run_simple completed: {preview}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("[%s] run_simple completed: %s", self.name, _preview(content))
+
+        messages.append(response)
 
         return AgentResponse(
-            messages=messages + [response],
+            messages=messages,
             content=content,
             has_tool_calls=has_tool_calls,
             is_first_call=True,
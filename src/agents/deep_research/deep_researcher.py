@@ -1,19 +1,36 @@
 # -----------------------------------------------------------------------------
 # Deep Researcher Agent
 #
-# Goes deep on ONE app at a time.
+# Goes deep on each app - one tool loop per app, several apps at once.
 # Researches revenue, differentiation, growth strategy, and clone difficulty.
 #
 # Usage in nodes:
 #   from agents.deep_research import DeepResearcherAgent
 #   agent = DeepResearcherAgent()
-#   result = await agent.run(state)
+#   results = await agent.research_apps([{"app_name": "..."}, ...])
 # -----------------------------------------------------------------------------
 
-from typing import Optional
-from langchain_core.messages import SystemMessage, HumanMessage
-from agents.base import Agent, AgentResponse, create_llm, logger
+import asyncio
+import logging
+from typing import Optional, List, Union
+from langchain_core.messages import HumanMessage, ToolMessage
+from agents.base import (
+    Agent,
+    AgentResponse,
+    create_llm,
+    extract_text_content,
+    log_cache_usage,
+    logger,
+)
+from agents.llm_cache import cached_ainvoke
 from config import DEEP_RESEARCHER
+from config.settings import DEEP_RESEARCHER_PARALLEL
+
+# the output tool - once the agent calls it, the app is done
+SUBMIT_TOOL_NAME = "submit_app_research"
+
+# safety cap on search rounds per app (the agent normally submits well before)
+MAX_TOOL_ROUNDS = 8
 
 
 class DeepResearcherAgent(Agent):
@@ -24,20 +41,26 @@ class DeepResearcherAgent(Agent):
 
     def __init__(self):
         super().__init__(DEEP_RESEARCHER)
+        self._tools_by_name = {t.name: t for t in self.config.tools}
 
-    def get_prompt_for_app(self, app_name: str, scratchpad_text: str = "") -> str:
+    def get_user_message_for_app(
+        self,
+        app_name: str,
+        app_description: str = "",
+        scratchpad_text: str = "",
+    ) -> HumanMessage:
         """
-        Generate a customized system prompt for researching a specific app.
+        Build the first user message for researching a specific app.
+        Everything app-specific goes here, after the cached system prefix.
         """
-        base_prompt = self.config.system_prompt.replace(
-            "[APP_NAME_PLACEHOLDER]",
-            app_name
-        )
+        user_input = f"Research this app: {app_name}"
+        if app_description:
+            user_input += f"\n\nKnown info: {app_description}"
 
         if scratchpad_text:
-            base_prompt += f"\n\n--- SCRATCHPAD ---\n{scratchpad_text}"
+            user_input += f"\n\n--- SCRATCHPAD ---\n{scratchpad_text}"
 
-        return base_prompt
+        return HumanMessage(content=user_input)
 
     async def research_app(
         self,
@@ -56,33 +79,115 @@ class DeepResearcherAgent(Agent):
         Returns:
             AgentResponse with first LLM call results
         """
-        system_prompt = self.get_prompt_for_app(app_name, scratchpad_text)
-
-        user_input = f"Research this app: {app_name}"
-        if app_description:
-            user_input += f"\n\nKnown info: {app_description}"
-
-        logger.info(f"[{self.name}] starting research on: {app_name}")
+        logger.info("[%s] starting research on: %s", self.name, app_name)
 
         messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=user_input),
+            self._system_message(),
+            self.get_user_message_for_app(app_name, app_description, scratchpad_text),
         ]
 
-        response = await self.llm.ainvoke(messages)
+        response = await cached_ainvoke(self.llm, messages, key_extra=self.cache_key_extra)
+        log_cache_usage(self.name, response)
 
-        has_tool_calls = False
-        if hasattr(response, "tool_calls") and response.tool_calls:
-            has_tool_calls = True
-            tool_names = [tc.get("name", "unknown") for tc in response.tool_calls]
-            logger.info(f"[{self.name}] requesting tools: {tool_names}")
+        tool_calls = getattr(response, "tool_calls", None)
+        has_tool_calls = bool(tool_calls)
+        if has_tool_calls and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[%s] requesting tools: %s",
+                self.name,
+                ", ".join(tc.get("name", "unknown") for tc in tool_calls),
+            )
 
-        from agents.base import extract_text_content
         content = extract_text_content(response.content)
 
+        messages.append(response)
+
         return AgentResponse(
-            messages=messages + [response],
+            messages=messages,
             content=content,
             has_tool_calls=has_tool_calls,
             is_first_call=True,
         )
+
+    async def research_app_to_completion(
+        self,
+        app_name: str,
+        app_description: str = "",
+        scratchpad_text: str = "",
+        max_rounds: int = MAX_TOOL_ROUNDS,
+    ) -> AgentResponse:
+        """
+        Research one app end to end: the first call, then tool rounds until
+        the agent calls submit_app_research (or stops calling tools).
+
+        Returns:
+            AgentResponse with the full message history - the last message
+            holds the submit_app_research call when the agent finished
+        """
+        result = await self.research_app(app_name, app_description, scratchpad_text)
+        messages = result.messages
+
+        for _ in range(max_rounds):
+            tool_calls = messages[-1].tool_calls if result.has_tool_calls else []
+            if not tool_calls or any(tc.get("name") == SUBMIT_TOOL_NAME for tc in tool_calls):
+                break
+            messages.extend(await asyncio.gather(*(self._run_tool(tc) for tc in tool_calls)))
+            result = await self.run({"user_request": "", "messages": messages})
+            messages.append(result.messages[-1])
+        else:
+            logger.warning("[%s] %s: no submission after %d tool rounds", self.name, app_name, max_rounds)
+
+        return AgentResponse(
+            messages=messages,
+            content=result.content,
+            has_tool_calls=result.has_tool_calls,
+            is_first_call=True,
+        )
+
+    async def _run_tool(self, tool_call: dict) -> ToolMessage:
+        """Run one requested tool; errors go back to the agent as the tool result (like ToolNode)."""
+        name = tool_call.get("name", "")
+        tool = self._tools_by_name.get(name)
+        try:
+            if tool is None:
+                raise ValueError(f"{name} is not a valid tool")
+            return await tool.ainvoke({**tool_call, "type": "tool_call"})
+        except Exception as e:
+            return ToolMessage(
+                content=f"Error: {e!r}\n Please fix your mistakes.",
+                name=name,
+                tool_call_id=tool_call["id"],
+                status="error",
+            )
+
+    async def research_apps(
+        self,
+        apps: List[dict],
+        *,
+        concurrency: int = DEEP_RESEARCHER_PARALLEL,
+    ) -> List[Union[AgentResponse, BaseException]]:
+        """
+        Research several apps at once, each through its full tool loop.
+        Apps run concurrently, capped by a semaphore
+        (DEEP_RESEARCHER_PARALLEL env var, default 8).
+
+        Args:
+            apps: One dict of research_app() kwargs per app
+                  (app_name, and optionally app_description, scratchpad_text)
+            concurrency: Max apps researched at the same time
+
+        Returns:
+            One AgentResponse per app, in input order. Failed apps are
+            returned as the exception instead of cancelling the batch.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def research_one(app: dict) -> AgentResponse:
+            async with semaphore:
+                return await self.research_app_to_completion(**app)
+
+        logger.info("[%s] researching %d apps (max %d concurrent)", self.name, len(apps), concurrency)
+        return await asyncio.gather(
+            *(research_one(app) for app in apps),
+            return_exceptions=True,
+        )
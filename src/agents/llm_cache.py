@@ -0,0 +1,388 @@
+# -----------------------------------------------------------------------------
+# LLM Response Cache
+#
+# Content-addressable on-disk cache around llm.ainvoke(). A request is keyed by
+# (prompt version, provider/model/agent extras, full message list), so an
+# identical request is answered from disk instead of another API call.
+#
+# Identical requests that are already in flight are coalesced: later callers
+# await the first caller's result instead of making their own API call.
+#
+# Agents can opt into a semantic tier (SEMANTIC_CACHE=1): on an exact miss, the
+# final user message is embedded and compared against earlier requests with the
+# same agent + system prompt, so near-duplicate inputs reuse a stored response.
+#
+# Disabled unless the LLM_CACHE_DIR environment variable is set.
+#
+# Usage:
+#   from agents.llm_cache import cached_ainvoke
+#   response = await cached_ainvoke(llm, messages, key_extra=(provider, model_id))
+# -----------------------------------------------------------------------------
+
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, List, Optional
+
+from langchain_core.messages import AIMessage, BaseMessage
+from pydantic import BaseModel, Field, ValidationError
+
+# same logger as agents.base (configured there)
+logger = logging.getLogger("agents")
+
+# Bump when prompts change in a way that should invalidate cached responses
+PROMPT_VERSION = "1"
+
+# orjson is optional - key serialization is the hot path, and it writes bytes
+# directly. Both variants sort keys; they don't produce identical bytes, so
+# installing orjson starts a fresh set of cache keys.
+try:
+    import orjson
+
+    def _dumps_sorted(data) -> bytes:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        )
+except ImportError:
+    def _dumps_sorted(data) -> bytes:
+        return json.dumps(data, sort_keys=True, default=str).encode()
+
+# Cache key -> task doing the disk lookup / LLM call for that key
+_inflight: dict[str, asyncio.Task] = {}
+
+# Semantic tier settings
+SEMANTIC_MODEL = "all-MiniLM-L6-v2"
+SEMANTIC_THRESHOLD = float(os.environ.get("SEMANTIC_CACHE_THRESHOLD", "0.98"))
+
+
+class CachedResponse(BaseModel):
+    """What gets stored on disk for one LLM response."""
+    content: Any  # str or list of content blocks
+    tool_calls: List[dict] = Field(default_factory=list)
+    ts: float
+
+
+def get_cache_dir() -> Optional[Path]:
+    """Cache directory from LLM_CACHE_DIR, or None if caching is disabled."""
+    cache_dir = os.environ.get("LLM_CACHE_DIR")
+    return Path(cache_dir) if cache_dir else None
+
+
+def make_cache_key(messages: List[BaseMessage], key_extra: tuple = ()) -> str:
+    """
+    Hash a request into a cache key.
+    Every segment is length-prefixed (8 bytes) so that e.g. moving text
+    between the system and human message can't produce the same digest.
+    """
+    # not a security boundary - 128-bit BLAKE2b is plenty and cheaper than SHA-256
+    hasher = hashlib.blake2b(digest_size=16)
+
+    def update(data: bytes):
+        hasher.update(len(data).to_bytes(8, "big"))
+        hasher.update(data)
+
+    update(PROMPT_VERSION.encode())
+    for part in key_extra:
+        update(str(part).encode())
+
+    for message in messages:
+        update(message.type.encode())
+        update(_dumps_sorted(message.content))
+        # tool call ids tie ToolMessages to the AIMessage that requested them
+        update(_dumps_sorted(getattr(message, "tool_calls", None) or []))
+        update((getattr(message, "tool_call_id", None) or "").encode())
+
+    return hasher.hexdigest()
+
+
+def _read_entry(path: Path) -> Optional[CachedResponse]:
+    """Load a cache entry, evicting it if it no longer matches the schema."""
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+    try:
+        return CachedResponse.model_validate_json(raw)
+    except ValidationError as e:
+        logger.warning("[llm_cache] evicting invalid entry %s: %s", path.name, e)
+        path.unlink(missing_ok=True)
+        return None
+
+
+def _write_entry(path: Path, response: BaseMessage):
+    """Store a response (write to temp file, then rename so readers never see partial JSON)."""
+    entry = CachedResponse(
+        content=response.content,
+        tool_calls=getattr(response, "tool_calls", None) or [],
+        ts=time.time(),
+    )
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(entry.model_dump_json())
+        tmp_path.replace(path)
+    except OSError as e:
+        logger.warning("[llm_cache] could not write %s: %s", path.name, e)
+
+
+class TTLMemo:
+    """
+    Small in-process memo with per-entry expiry, for agent methods whose
+    prompt is fully determined by a cheap key (e.g. the planner's categories).
+    Expired entries are dropped on access and whenever a new one is stored.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict = {}  # key -> (stored_at, value)
+
+    def get(self, key) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self.ttl_seconds:
+            del self._entries[key]
+            return None
+        return value
+
+    def put(self, key, value):
+        now = time.monotonic()
+        expired = [k for k, (stored_at, _) in self._entries.items() if now - stored_at >= self.ttl_seconds]
+        for k in expired:
+            del self._entries[k]
+        self._entries[key] = (now, value)
+
+
+# -----------------------------------------------------------------------------
+# Semantic tier
+#
+# Brute-force cosine search (normalized dot product) over a small numpy matrix,
+# persisted next to the exact-match entries. Needs the optional numpy and
+# sentence-transformers packages; without them the tier silently stays off.
+# -----------------------------------------------------------------------------
+def semantic_cache_enabled() -> bool:
+    """True if SEMANTIC_CACHE=1 (and LLM_CACHE_DIR is set)."""
+    return os.environ.get("SEMANTIC_CACHE") == "1" and get_cache_dir() is not None
+
+
+class SemanticCache:
+    """
+    Embedding index over the final user message of cached requests.
+    Each row is (scope, entry key) - scope hashes everything except the final
+    message, so only requests to the same agent with the same system prompt
+    can match each other.
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.dir = cache_dir / "semantic"
+        self._lock = threading.Lock()
+        self._model_lock = threading.Lock()
+        self._model = None
+        self._unavailable = False
+        self._vectors = None  # (n, dim) float32, rows L2-normalized
+        self._rows: list[list[str]] = []  # [scope, entry key] per vector
+        self._load()
+
+    def _load(self):
+        try:
+            import numpy as np
+        except ImportError:
+            return
+        try:
+            self._rows = json.loads((self.dir / "rows.json").read_bytes())
+            self._vectors = np.load(self.dir / "vectors.npy")
+        except (OSError, ValueError):
+            self._rows, self._vectors = [], None
+        if self._vectors is not None and len(self._vectors) != len(self._rows):
+            logger.warning("[llm_cache] semantic index out of sync, starting fresh")
+            self._rows, self._vectors = [], None
+
+    def _get_model(self):
+        """The embedding model, loaded once (concurrent first lookups share one load)."""
+        if self._model is None and not self._unavailable:
+            with self._model_lock:
+                if self._model is None and not self._unavailable:
+                    try:
+                        from sentence_transformers import SentenceTransformer
+                    except ImportError:
+                        logger.warning("[llm_cache] SEMANTIC_CACHE=1 but sentence-transformers is not installed")
+                        self._unavailable = True
+                        return None
+                    self._model = SentenceTransformer(SEMANTIC_MODEL, device="cpu")
+        return self._model
+
+    def _embed(self, text: str):
+        """
+        Normalized embedding for text, or None if the model isn't available or
+        text is longer than the model reads - past max_seq_length the rest is
+        truncated away, so inputs differing only there would look identical.
+        """
+        model = self._get_model()
+        if model is None:
+            return None
+        limit = model.max_seq_length
+        tokens = model.tokenizer(text, truncation=True, max_length=limit + 1)["input_ids"]
+        if len(tokens) > limit:
+            logger.debug("[llm_cache] input over %d tokens, skipping semantic tier", limit)
+            return None
+        return model.encode(text, normalize_embeddings=True).astype("float32")
+
+    def lookup(self, scope: str, text: str):
+        """
+        Find a stored request in the same scope whose message is within
+        SEMANTIC_THRESHOLD cosine similarity of text.
+
+        Returns:
+            (entry key or None, embedding of text to pass to add())
+        """
+        vector = self._embed(text)
+        if vector is None:
+            return None, None
+
+        with self._lock:
+            if self._vectors is None:
+                return None, vector
+            scores = self._vectors @ vector
+            best_key, best_score = None, SEMANTIC_THRESHOLD
+            for (row_scope, row_key), score in zip(self._rows, scores):
+                if row_scope == scope and score >= best_score:
+                    best_key, best_score = row_key, score
+
+        return best_key, vector
+
+    def add(self, scope: str, key: str, vector):
+        """Index a newly stored response and persist the index."""
+        if vector is None:
+            return
+        import numpy as np
+
+        with self._lock:
+            row = vector.reshape(1, -1)
+            self._vectors = row if self._vectors is None else np.vstack([self._vectors, row])
+            self._rows.append([scope, key])
+            try:
+                self.dir.mkdir(parents=True, exist_ok=True)
+                tmp_vectors = self.dir / "vectors.tmp.npy"
+                np.save(tmp_vectors, self._vectors)
+                tmp_vectors.replace(self.dir / "vectors.npy")
+                tmp_rows = self.dir / "rows.tmp"
+                tmp_rows.write_bytes(_dumps_sorted(self._rows))
+                tmp_rows.replace(self.dir / "rows.json")
+            except OSError as e:
+                logger.warning("[llm_cache] could not persist semantic index: %s", e)
+
+
+_semantic_caches: dict[Path, SemanticCache] = {}
+_semantic_caches_lock = threading.Lock()
+
+
+def _get_semantic_cache(cache_dir: Path) -> SemanticCache:
+    """One SemanticCache per cache directory (built on first use)."""
+    with _semantic_caches_lock:
+        index = _semantic_caches.get(cache_dir)
+        if index is None:
+            index = _semantic_caches[cache_dir] = SemanticCache(cache_dir)
+        return index
+
+
+def _message_text(message: BaseMessage) -> str:
+    """Text used for the semantic comparison."""
+    content = message.content
+    return content if type(content) is str else json.dumps(content, default=str)
+
+
+def _finish_inflight(key: str, task: asyncio.Task):
+    """Done callback: forget the in-flight task (and mark its error as seen)."""
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    if not task.cancelled():
+        task.exception()
+
+
+async def _load_or_invoke(
+    llm,
+    messages: List[BaseMessage],
+    key: str,
+    path: Path,
+    semantic_scope: Optional[str],
+) -> BaseMessage:
+    """Answer from disk if possible, otherwise call the LLM and store the response."""
+    cached = await asyncio.to_thread(_read_entry, path)
+    if cached is not None:
+        logger.debug("[llm_cache] hit %.12s", key)
+        return AIMessage(content=cached.content, tool_calls=cached.tool_calls)
+
+    index = vector = None
+    if semantic_scope is not None:
+        index = _get_semantic_cache(path.parent)
+        match, vector = await asyncio.to_thread(
+            index.lookup, semantic_scope, _message_text(messages[-1])
+        )
+        if match is not None:
+            cached = await asyncio.to_thread(_read_entry, path.parent / f"{match}.json")
+            if cached is not None:
+                logger.debug("[llm_cache] semantic hit %.12s -> %.12s", key, match)
+                return AIMessage(content=cached.content, tool_calls=cached.tool_calls)
+
+    response = await llm.ainvoke(messages)
+    await asyncio.to_thread(_write_entry, path, response)
+    if index is not None:
+        await asyncio.to_thread(index.add, semantic_scope, key, vector)
+    return response
+
+
+async def cached_ainvoke(
+    llm,
+    messages: List[BaseMessage],
+    *,
+    key_extra: tuple = (),
+    semantic: bool = False,
+) -> BaseMessage:
+    """
+    Drop-in replacement for llm.ainvoke(messages) that checks the disk cache first.
+
+    Args:
+        llm: LangChain chat model (possibly tool-bound)
+        messages: Messages to send
+        key_extra: Anything else that changes the response (provider, model, tools)
+        semantic: Also match near-duplicate final messages (if SEMANTIC_CACHE=1)
+
+    Returns:
+        The LLM response (an AIMessage rebuilt from disk on a cache hit)
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return await llm.ainvoke(messages)
+
+    key = make_cache_key(messages, key_extra)
+
+    task = _inflight.get(key)
+    if task is not None:
+        logger.debug("[llm_cache] joining in-flight request %.12s", key)
+        # shield: a cancelled follower must not cancel the shared call
+        response = await asyncio.shield(task)
+        # own copy, since the add_messages reducer sets ids in place
+        return response.model_copy()
+
+    path = cache_dir / f"{key}.json"
+    semantic_scope = None
+    if semantic and len(messages) > 1 and semantic_cache_enabled():
+        semantic_scope = make_cache_key(messages[:-1], key_extra)
+
+    task = asyncio.ensure_future(_load_or_invoke(llm, messages, key, path, semantic_scope))
+    # an eager task factory may have finished it already
+    if not task.done():
+        _inflight[key] = task
+        task.add_done_callback(functools.partial(_finish_inflight, key))
+
+    return await asyncio.shield(task)
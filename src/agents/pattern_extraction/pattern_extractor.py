@@ -10,6 +10,7 @@
 #   result = await agent.extract_patterns(apps_summary)
 # -----------------------------------------------------------------------------
 
+from langchain_core.messages import HumanMessage
 from agents.base import Agent, AgentResponse
 from config import PATTERN_EXTRACTOR
 
@@ -20,6 +21,10 @@ class PatternExtractorAgent(Agent):
     Analyzes trends, gaps, and opportunities across all researched apps.
     """
 
+    # summaries often differ only in ordering/whitespace between runs
+    # (the cache skips inputs too long for the embedding model to see in full)
+    semantic_cache = True
+
     def __init__(self):
         super().__init__(PATTERN_EXTRACTOR)
 
@@ -34,4 +39,8 @@ class PatternExtractorAgent(Agent):
             AgentResponse with JSON patterns, gaps, and best opportunities
         """
         prompt = f"Analyze these apps and extract patterns:\n\n{apps_summary}"
-        return await self.run_simple(prompt)
+        # reuses the agent's cached system message instead of rebuilding it
+        return await self._ainvoke([
+            self._system_message(),
+            HumanMessage(content=prompt),
+        ])
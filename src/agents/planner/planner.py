@@ -11,8 +11,12 @@
 # -----------------------------------------------------------------------------
 
 from agents.base import Agent, AgentResponse
+from agents.llm_cache import TTLMemo
 from config import PLANNER_AGENT
 
+# Plans keyed by normalized category set - the same categories get the same plan
+_plan_cache = TTLMemo(ttl_seconds=24 * 60 * 60)
+
 
 class PlannerAgent(Agent):
     """
@@ -33,6 +37,13 @@ class PlannerAgent(Agent):
         Returns:
             AgentResponse with JSON-formatted sub-queries
         """
+        key = frozenset(c.strip().lower() for c in categories)
+        cached = _plan_cache.get(key)
+        if cached is not None:
+            return cached
+
         categories_text = ", ".join(categories)
         prompt = f"Generate research sub-queries for these app categories: {categories_text}"
-        return await self.run_simple(prompt)
+        result = await self.run_simple(prompt)
+        _plan_cache.put(key, result)
+        return result
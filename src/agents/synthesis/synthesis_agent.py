@@ -10,9 +10,25 @@
 #   result = await agent.synthesize(data)
 # -----------------------------------------------------------------------------
 
+from string import Template
+
 from agents.base import Agent, AgentResponse
 from config import SYNTHESIS_AGENT
 
+# Report prompt, parsed once at import; sections are substituted per call
+_SYNTHESIS_TEMPLATE = Template("""Create a comprehensive report from this research:
+
+## APPS RESEARCHED
+$apps
+
+## PATTERNS IDENTIFIED
+$patterns
+
+## MARKET GAPS
+$gaps
+
+Transform this into a Reddit-post-quality report with actionable insights.""")
+
 
 class SynthesisAgent(Agent):
     """
@@ -40,17 +56,10 @@ class SynthesisAgent(Agent):
         Returns:
             AgentResponse with the final markdown report
         """
-        prompt = f"""Create a comprehensive report from this research:
-
-## APPS RESEARCHED
-{apps_summary}
-
-## PATTERNS IDENTIFIED
-{patterns_data}
-
-## MARKET GAPS
-{gaps_data}
-
-Transform this into a Reddit-post-quality report with actionable insights."""
+        prompt = _SYNTHESIS_TEMPLATE.substitute(
+            apps=apps_summary,
+            patterns=patterns_data,
+            gaps=gaps_data,
+        )
 
         return await self.run_simple(prompt)
@@ -1,8 +1,37 @@
+import asyncio
+import functools
+import json
+import logging
 import os
+import re
+import time
+from collections import OrderedDict, deque
+from urllib.parse import urlsplit
 from typing import List, Optional
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
-from tavily import TavilyClient
+import httpx
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+# same logger as agents.base (configured there)
+logger = logging.getLogger("agents")
+
+# orjson is optional - used for Tavily responses and tool output when present;
+# the stdlib fallback produces equivalent JSON
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _json_dumps_str(data) -> str:
+        return orjson.dumps(data).decode()
+except ImportError:
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _json_dumps_str(data) -> str:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
 
 
 # =============================================================================
@@ -39,103 +68,384 @@ class AppResearch(BaseModel):
     sources: List[str] = Field(default_factory=list, description="URLs where you found this info")
 
 
-# Lazy initialization to avoid errors when API key isn't set yet
-_tavily_client = None
+# Searches go straight to Tavily's REST endpoint over one pooled httpx client
+# (the SDK's async client opens a new connection per call). Created lazily to
+# avoid errors when the API key isn't set yet. Connections belong to an event
+# loop, so the client is rebuilt if the running loop changes - call
+# aclose_search_http_client() before the loop shuts down.
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+_search_http_client: Optional[httpx.AsyncClient] = None
+_search_http_loop: Optional[asyncio.AbstractEventLoop] = None
 
+# closes of clients left behind by an earlier loop (kept so they aren't GC'd mid-close)
+_stale_client_closes: set[asyncio.Task] = set()
 
-def get_tavily_client() -> TavilyClient:
-    """Get or create the Tavily client."""
-    global _tavily_client
-    if _tavily_client is None:
+
+async def _aclose_stale_client(client: httpx.AsyncClient):
+    """Close a client from a previous loop - best effort, that loop may be gone."""
+    try:
+        await client.aclose()
+    except Exception:
+        pass
+
+
+def get_search_http_client() -> httpx.AsyncClient:
+    """Get or create the pooled HTTP client for async Tavily searches."""
+    global _search_http_client, _search_http_loop
+    loop = asyncio.get_running_loop()
+    if _search_http_client is None or _search_http_loop is not loop:
         api_key = os.environ.get("TAVILY_API_KEY")
         if not api_key:
             raise ValueError("TAVILY_API_KEY environment variable not set")
-        _tavily_client = TavilyClient(api_key=api_key)
-    return _tavily_client
+        if _search_http_client is not None:
+            task = loop.create_task(_aclose_stale_client(_search_http_client))
+            _stale_client_closes.add(task)
+            task.add_done_callback(_stale_client_closes.discard)
+        _search_http_client = httpx.AsyncClient(
+            headers={"Authorization": f"Bearer {api_key}"},
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32, keepalive_expiry=60),
+            timeout=60,
+        )
+        _search_http_loop = loop
+    return _search_http_client
+
+
+async def aclose_search_http_client():
+    """Close the pooled search client and its connections (call at shutdown)."""
+    global _search_http_client, _search_http_loop
+    client, _search_http_client, _search_http_loop = _search_http_client, None, None
+    if client is not None:
+        await client.aclose()
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Rate limits, server errors, timeouts and dropped connections are worth retrying."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == 429 or error.response.status_code >= 500
+    return isinstance(error, (httpx.TransportError, asyncio.TimeoutError))
+
+
+# Every Tavily request (retries included) goes through one shared limiter, so
+# concurrent tool calls across agents stay within the request quota
+TAVILY_RATE_LIMIT = 60          # requests...
+TAVILY_RATE_PERIOD_SECONDS = 60  # ...per this many seconds
+
+
+class _RateLimiter:
+    """
+    Allow at most max_calls acquisitions per period (sliding window).
+    The check and the append have no await in between, so no lock is needed -
+    waiters sleep independently and re-check when a slot should be free.
+    """
+
+    def __init__(self, max_calls: int, period: float):
+        self.max_calls = max_calls
+        self.period = period
+        self._calls: deque[float] = deque()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            while self._calls and now - self._calls[0] >= self.period:
+                self._calls.popleft()
+            if len(self._calls) < self.max_calls:
+                self._calls.append(now)
+                return
+            await asyncio.sleep(self.period - (now - self._calls[0]))
+
+
+_tavily_limiter = _RateLimiter(TAVILY_RATE_LIMIT, TAVILY_RATE_PERIOD_SECONDS)
+
+
+# Deadline for one Tavily request. It applies per attempt, inside the retry,
+# so a slow attempt is cancelled and retried instead of using up the budget
+# of the whole retry schedule.
+SEARCH_ATTEMPT_TIMEOUT_SECONDS = 15
+
+
+# A transient Tavily failure would otherwise fail the whole tool call and
+# cost the agent another LLM turn to recover
+@retry(
+    stop=stop_after_attempt(4),
+    wait=wait_random_exponential(min=0.5, max=8),
+    retry=retry_if_exception(_is_transient),
+    reraise=True,
+)
+async def _async_search(query: str, **options) -> dict:
+    """POST one search to Tavily on the shared connection pool (retried on transient errors)."""
+    await _tavily_limiter.acquire()
+    async with asyncio.timeout(SEARCH_ATTEMPT_TIMEOUT_SECONDS):
+        response = await get_search_http_client().post(TAVILY_SEARCH_URL, json={"query": query, **options})
+    response.raise_for_status()
+    return _json_loads(response.content)
 
 
 # =============================================================================
-# CORE WEB SEARCH TOOL
+# SEARCH CACHE
+# Agents re-issue near-identical queries across phases ("X App Store iOS app"
+# vs "X iOS app App Store"). Results are cached in-process, keyed on the
+# query's sorted lowercase tokens (the query as written when it uses search
+# operators) plus the search options, with a TTL and LRU eviction.
 # =============================================================================
-@tool
-def web_search(query: str) -> str:
-    """Search the web for current information. Use this to find
-    trending apps, App Store charts, app rankings, and app news."""
+SEARCH_CACHE_TTL_SECONDS = 6 * 60 * 60
+SEARCH_CACHE_MAX_ENTRIES = 512
+
+_search_cache: "OrderedDict[tuple, tuple[float, dict]]" = OrderedDict()
+
+# Searches currently in flight, so concurrent identical misses share one request
+_inflight_searches: dict[tuple, asyncio.Task] = {}
+
+
+# Quoted phrases, -exclusions/+required terms and site:-style operators change
+# what a search returns, so queries using them aren't token-normalized
+_SEARCH_OPERATOR = re.compile(r'"|\w:|(?:^|\s)[-+]\S')
+
+
+def _search_key(query: str, options: dict) -> tuple:
+    """Normalized cache key: word order and case don't matter (for queries without operators)."""
+    if _SEARCH_OPERATOR.search(query):
+        # only case and spacing are normalized
+        tokens = " ".join(query.lower().split())
+    else:
+        tokens = " ".join(sorted(re.findall(r"\w+", query.lower())))
+    return (tokens, tuple(sorted((k, repr(v)) for k, v in options.items())))
+
+
+def _search_cache_get(key: tuple) -> Optional[dict]:
+    entry = _search_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, response = entry
+    if time.monotonic() - stored_at >= SEARCH_CACHE_TTL_SECONDS:
+        del _search_cache[key]
+        return None
+    _search_cache.move_to_end(key)
+    return response
+
+
+def _search_cache_put(key: tuple, response: dict):
+    _search_cache[key] = (time.monotonic(), response)
+    _search_cache.move_to_end(key)
+    while len(_search_cache) > SEARCH_CACHE_MAX_ENTRIES:
+        _search_cache.popitem(last=False)
+
+
+async def _fetch_and_cache(key: tuple, query: str, options: dict) -> dict:
+    response = await _async_search(query, **options)
+    _search_cache_put(key, response)
+    return response
+
+
+def _finish_inflight_search(key: tuple, task: asyncio.Task):
+    """Done callback: forget the in-flight search (and mark its error as seen)."""
+    if _inflight_searches.get(key) is task:
+        del _inflight_searches[key]
+    if not task.cancelled():
+        task.exception()
+
+
+async def _cached_search(query: str, **options) -> dict:
+    """_async_search() with the in-process result cache and in-flight coalescing."""
+    key = _search_key(query, options)
+    response = _search_cache_get(key)
+    if response is not None:
+        return response
+
+    task = _inflight_searches.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_and_cache(key, query, options))
+        # an eager task factory may have finished it already
+        if not task.done():
+            _inflight_searches[key] = task
+            task.add_done_callback(functools.partial(_finish_inflight_search, key))
+
+    # shield: a cancelled caller must not cancel the search others are awaiting
+    return await asyncio.shield(task)
+
+
+# Search tools return results as compact JSON - only the fields the agents
+# use, with content clipped - rather than prose the LLM has to re-parse.
+# Budgets are in UTF-8 bytes so output size is bounded whatever the script.
+MAX_CONTENT_BYTES = 1024        # per result
+MAX_TOOL_OUTPUT_BYTES = 6144    # content across all results of one call
+
+# Fixed search parameters, built once
+_APP_STORE_DOMAINS = ("apps.apple.com", "appfigures.com", "sensortower.com", "data.ai", "appmagic.rocks")
+# Tavily's include_domains filter isn't strict - results are re-checked locally
+_APP_STORE_HOSTS = frozenset(_APP_STORE_DOMAINS)
+_APP_STORE_HOST_SUFFIXES = tuple("." + d for d in _APP_STORE_DOMAINS)
+_REVENUE_QUERY_TEMPLATES = (
+    "{app} app revenue estimate",
+    "{app} downloads Sensor Tower data.ai",
+    "{app} app monthly revenue earnings",
+)
+_SOCIAL_QUERY_TEMPLATES = (
+    "{app} app TikTok viral",
+    "{app} app reddit discussion review",
+    "{app} app Twitter trending",
+)
+
+def _truncate_utf8(text: str, max_bytes: int) -> str:
+    """Cut text to at most max_bytes of UTF-8, never splitting a character."""
+    if len(text) * 4 <= max_bytes:
+        # can't exceed the budget even if every char is 4 bytes
+        return text
+    return text.encode("utf-8")[:max_bytes].decode("utf-8", errors="ignore")
+
+
+def _format_results(results, budget: int = MAX_TOOL_OUTPUT_BYTES) -> str:
+    """
+    Render search results as a JSON list of {title, url, content}.
+    Stops adding results once budget bytes of content are used.
+    Empty string if none.
+    """
+    trimmed = []
+    for r in results:
+        content = _truncate_utf8(r["content"] or "", min(MAX_CONTENT_BYTES, budget))
+        trimmed.append({"title": r["title"], "url": r["url"], "content": content})
+        budget -= len(content.encode("utf-8"))
+        if budget <= 0:
+            break
+    return _json_dumps_str(trimmed) if trimmed else ""
+
+
+def _dedupe_results(response: dict) -> List[dict]:
+    """
+    First result per URL.
+    Overlapping phrasings tend to surface the same pages - no need to
+    send them to the LLM twice.
+    """
+    seen: set[str] = set()
+    kept = []
+    for r in response.get("results", ()):
+        url = r.get("url")
+        if url in seen:
+            continue
+        seen.add(url)
+        kept.append(r)
+    return kept
+
+
+def _combined_query(queries: List[str]) -> str:
+    """Fold several search phrasings into one OR query (one API call instead of N)."""
+    return " OR ".join(f'"{query}"' for query in queries)
+
 
-    response = get_tavily_client().search(
-        query=query,
+# =============================================================================
+# CORE WEB SEARCH TOOL
+# =============================================================================
+async def _search_web(query: str) -> dict:
+    return await _cached_search(
+        query,
         max_results=10,
         search_depth="advanced",
     )
 
-    results = []
-    for r in response.get("results", []):
-        results.append(
-            f"Title: {r['title']}\n"
-            f"URL: {r['url']}\n"
-            f"Content: {r['content']}\n"
-        )
 
-    return "\n---\n".join(results) if results else "No results found."
+@tool
+async def web_search(query: str) -> str:
+    """Search the web for current information. Use this to find
+    trending apps, App Store charts, app rankings, and app news."""
+
+    response = await _search_web(query)
+
+    return _format_results(response.get("results", ())) or "No results found."
 
 
 # =============================================================================
 # APP STORE SEARCH TOOL
 # Uses Tavily to search for App Store specific info
 # =============================================================================
-@tool
-def app_store_search(query: str) -> str:
-    """Search for App Store information about an app. Use this to find
-    app rankings, ratings, reviews, developer info, and App Store page details.
-    Add 'App Store' or 'iOS app' to your query for best results."""
+def _is_app_store_url(url: str) -> bool:
+    """True if url is on one of the App Store data domains (or a subdomain)."""
+    host = urlsplit(url).hostname or ""
+    return host in _APP_STORE_HOSTS or host.endswith(_APP_STORE_HOST_SUFFIXES)
+
 
+async def _search_app_store(query: str) -> dict:
     # Enhance query for App Store results
     enhanced_query = f"{query} App Store iOS app"
 
-    response = get_tavily_client().search(
-        query=enhanced_query,
+    response = await _cached_search(
+        enhanced_query,
         max_results=8,
         search_depth="advanced",
-        include_domains=["apps.apple.com", "appfigures.com", "sensortower.com", "data.ai", "appmagic.rocks"],
+        include_domains=_APP_STORE_DOMAINS,
     )
 
-    results = []
-    for r in response.get("results", []):
-        results.append(
-            f"Source: {r['url']}\n"
-            f"Title: {r['title']}\n"
-            f"Content: {r['content']}\n"
-        )
+    # drop off-domain rows before they reach the LLM
+    results = [r for r in response.get("results", ()) if _is_app_store_url(r.get("url") or "")]
+    return {**response, "results": results}
 
-    return "\n---\n".join(results) if results else "No App Store results found."
+
+@tool
+async def app_store_search(query: str) -> str:
+    """Search for App Store information about an app. Use this to find
+    app rankings, ratings, reviews, developer info, and App Store page details.
+    Add 'App Store' or 'iOS app' to your query for best results."""
+
+    response = await _search_app_store(query)
+
+    return _format_results(response.get("results", ())) or "No App Store results found."
 
 
 # =============================================================================
 # PRODUCT HUNT SEARCH TOOL
 # Searches for Product Hunt launches and discussions
 # =============================================================================
-@tool
-def product_hunt_search(query: str) -> str:
-    """Search Product Hunt for recently launched products, upvotes,
-    maker info, and launch discussions. Good for finding new indie apps."""
-
+async def _search_product_hunt(query: str) -> dict:
     enhanced_query = f"{query} site:producthunt.com OR Product Hunt launch"
 
-    response = get_tavily_client().search(
-        query=enhanced_query,
+    return await _cached_search(
+        enhanced_query,
         max_results=8,
         search_depth="advanced",
     )
 
-    results = []
-    for r in response.get("results", []):
-        results.append(
-            f"Source: {r['url']}\n"
-            f"Title: {r['title']}\n"
-            f"Content: {r['content']}\n"
-        )
 
-    return "\n---\n".join(results) if results else "No Product Hunt results found."
+@tool
+async def product_hunt_search(query: str) -> str:
+    """Search Product Hunt for recently launched products, upvotes,
+    maker info, and launch discussions. Good for finding new indie apps."""
+
+    response = await _search_product_hunt(query)
+
+    return _format_results(response.get("results", ())) or "No Product Hunt results found."
+
+
+# =============================================================================
+# COMBINED DISCOVERY SEARCH TOOL
+# Web + App Store + Product Hunt for one query, all at once - saves the agent
+# two tool-call round-trips when it would have run all three anyway
+# =============================================================================
+_DISCOVER_SOURCES = ("web", "app_store", "product_hunt")
+
+
+@tool
+async def discover_all(query: str) -> str:
+    """Search the web, App Store data sources, and Product Hunt for a query
+    in one call. Use this when you want all three views of the same query -
+    results are merged and duplicate pages removed."""
+
+    # each source fails on its own (every attempt has its own deadline, see
+    # _async_search) - the others are still returned
+    responses = await asyncio.gather(
+        _search_web(query),
+        _search_app_store(query),
+        _search_product_hunt(query),
+        return_exceptions=True,
+    )
+    ok = []
+    for source, response in zip(_DISCOVER_SOURCES, responses):
+        if isinstance(response, BaseException):
+            logger.warning("[discover_all] dropped %s results for %r: %r", source, query, response)
+        else:
+            ok.append(response)
+    if not ok:
+        raise responses[0]
+    merged = {"results": [r for response in ok for r in response.get("results", ())]}
+
+    return _format_results(_dedupe_results(merged)) or "No results found."
 
 
 # =============================================================================
@@ -143,33 +453,20 @@ def product_hunt_search(query: str) -> str:
 # Searches for app revenue and download estimates
 # =============================================================================
 @tool
-def estimate_app_revenue(app_name: str) -> str:
+async def estimate_app_revenue(app_name: str) -> str:
     """Search for revenue and download estimates for an app.
     Looks for data from Sensor Tower, AppMagic, data.ai, and similar sources."""
 
-    queries = [
-        f"{app_name} app revenue estimate",
-        f"{app_name} downloads Sensor Tower data.ai",
-        f"{app_name} app monthly revenue earnings",
-    ]
-
-    all_results = []
-    client = get_tavily_client()
-    for query in queries:
-        response = client.search(
-            query=query,
-            max_results=5,
-            search_depth="advanced",
-        )
+    queries = [t.format(app=app_name) for t in _REVENUE_QUERY_TEMPLATES]
 
-        for r in response.get("results", []):
-            all_results.append(
-                f"Source: {r['url']}\n"
-                f"Title: {r['title']}\n"
-                f"Content: {r['content']}\n"
-            )
+    # one search covering all phrasings
+    response = await _cached_search(
+        _combined_query(queries),
+        max_results=12,
+        search_depth="advanced",
+    )
 
-    return "\n---\n".join(all_results) if all_results else "No revenue data found."
+    return _format_results(_dedupe_results(response)) or "No revenue data found."
 
 
 # =============================================================================
@@ -177,34 +474,20 @@ def estimate_app_revenue(app_name: str) -> str:
 # Searches for social media mentions and viral moments
 # =============================================================================
 @tool
-def social_buzz_search(app_name: str) -> str:
+async def social_buzz_search(app_name: str) -> str:
     """Search for social media mentions of an app - TikTok videos,
     Reddit threads, Twitter discussions. Good for understanding viral moments."""
 
-    queries = [
-        f"{app_name} app TikTok viral",
-        f"{app_name} app reddit discussion review",
-        f"{app_name} app Twitter trending",
-    ]
-
-    all_results = []
-    client = get_tavily_client()
-    for query in queries:
-        response = client.search(
-            query=query,
-            max_results=5,
-            search_depth="advanced",
-        )
+    queries = [t.format(app=app_name) for t in _SOCIAL_QUERY_TEMPLATES]
 
-        for r in response.get("results", []):
-            all_results.append(
-                f"Platform mention for {app_name}:\n"
-                f"Source: {r['url']}\n"
-                f"Title: {r['title']}\n"
-                f"Content: {r['content']}\n"
-            )
+    # one search covering all phrasings
+    response = await _cached_search(
+        _combined_query(queries),
+        max_results=12,
+        search_depth="advanced",
+    )
 
-    return "\n---\n".join(all_results) if all_results else "No social media mentions found."
+    return _format_results(_dedupe_results(response)) or "No social media mentions found."
 
 
 # =============================================================================
@@ -214,7 +497,7 @@ def social_buzz_search(app_name: str) -> str:
 # =============================================================================
 
 @tool
-def submit_discovered_apps(apps: List[DiscoveredApp]) -> str:
+async def submit_discovered_apps(apps: List[DiscoveredApp]) -> str:
     """Submit the indie apps you discovered. Call this ONLY when you are done
     searching and have found 8+ indie apps worth researching. Pass all the apps
     you found with their details."""
@@ -222,7 +505,7 @@ def submit_discovered_apps(apps: List[DiscoveredApp]) -> str:
 
 
 @tool
-def submit_app_research(research: AppResearch) -> str:
+async def submit_app_research(research: AppResearch) -> str:
     """Submit your research findings for this app. Call this when you have
     gathered enough information about the app's revenue, features, growth
     strategy, and clone potential."""
@@ -239,6 +522,7 @@ RESEARCH_TOOLS = [web_search]
 
 # Discovery phase tools - broad search for finding apps
 DISCOVERY_TOOLS = [
+    discover_all,
     web_search,
     app_store_search,
     product_hunt_search,
@@ -256,6 +540,7 @@ DEEP_RESEARCH_TOOLS = [
 
 # All available tools
 ALL_TOOLS = [
+    discover_all,
     web_search,
     app_store_search,
     product_hunt_search,
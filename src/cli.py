@@ -7,14 +7,32 @@
 
 import os
 import sys
+import functools
+import json
+import string
 import argparse
-from typing import List, Optional
-from datetime import datetime
-
-import questionary
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
+from typing import TYPE_CHECKING, Any, Callable, List, Optional
+from datetime import date
+
+# questionary (prompt_toolkit) and rich are imported where they're used, so
+# scripted runs and save_report callers don't pay for them at import time
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.panel import Panel
+
+# orjson is optional - reports can be large, and it writes bytes directly
+try:
+    import orjson
+
+    def _dumps_report(data) -> bytes:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+except ImportError:
+    def _dumps_report(data) -> bytes:
+        return json.dumps(data, indent=2, default=str).encode()
 
 
 # =============================================================================
@@ -49,6 +67,27 @@ PRESET_CATEGORIES = [
     "Mac Menu Bar Utilities",
 ]
 
+# Checkbox choices: the presets plus a custom option at the end
+_CUSTOM_CHOICE = "[Custom] Enter your own niche..."
+_CATEGORY_CHOICES = (*PRESET_CATEGORIES, _CUSTOM_CHOICE)
+
+
+# =============================================================================
+# CONSOLE
+# One Console per process - creating one probes the terminal every time
+# =============================================================================
+
+_console: "Optional[Console]" = None
+_banner_panel: "Optional[Panel]" = None
+
+
+def _get_console() -> "Console":
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
 
 # =============================================================================
 # CLI FUNCTIONS
@@ -56,93 +95,113 @@ PRESET_CATEGORIES = [
 
 def show_banner():
     """Display the ALPHY ASCII banner."""
-    console = Console()
-    console.print(Panel(
-        Text(ALPHY_BANNER, style="green"),
-        border_style="green",
-        padding=(0, 2)
-    ))
-
-
+    global _banner_panel
+    if _banner_panel is None:
+        from rich.panel import Panel
+        from rich.text import Text
+        _banner_panel = Panel(
+            Text(ALPHY_BANNER, style="green"),
+            border_style="green",
+            padding=(0, 2)
+        )
+    _get_console().print(_banner_panel)
+
+
+def _safe_prompt(default_factory: Callable[[], Any]):
+    """
+    Decorator for interactive prompts: Ctrl+C (KeyboardInterrupt) or an empty
+    answer returns default_factory() instead.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs) or default_factory()
+            except KeyboardInterrupt:
+                return default_factory()
+        return wrapper
+    return decorator
+
+
+@_safe_prompt(list)
 def select_categories() -> List[str]:
     """
     Interactive category selection with checkboxes.
     Returns list of selected categories.
     """
-    # Add custom option at the end
-    choices = PRESET_CATEGORIES + ["[Custom] Enter your own niche..."]
-
-    try:
-        selected = questionary.checkbox(
-            "Select categories to research (space to select, enter to confirm):",
-            choices=choices,
-            instruction="(Use arrow keys to move, space to select, enter to confirm)"
-        ).ask()
-
-        if selected is None:
-            # User cancelled (Ctrl+C)
-            return []
-
-        # Handle custom input
-        final_categories = []
-        for s in selected:
-            if "[Custom]" in s:
-                custom = questionary.text(
-                    "Enter custom niche(s) (comma-separated):"
-                ).ask()
-                if custom:
-                    for c in custom.split(","):
-                        c = c.strip()
-                        if c:
-                            final_categories.append(c)
-            else:
-                final_categories.append(s)
-
-        return final_categories
-
-    except KeyboardInterrupt:
+    import questionary
+
+    selected = questionary.checkbox(
+        "Select categories to research (space to select, enter to confirm):",
+        choices=list(_CATEGORY_CHOICES),
+        instruction="(Use arrow keys to move, space to select, enter to confirm)"
+    ).ask()
+
+    if selected is None:
+        # User cancelled (Ctrl+C)
         return []
 
+    # Handle custom input
+    final_categories = []
+    for s in selected:
+        if s == _CUSTOM_CHOICE:
+            custom = questionary.text(
+                "Enter custom niche(s) (comma-separated):"
+            ).ask()
+            if custom:
+                final_categories.extend(_csv(custom))
+        else:
+            final_categories.append(s)
+
+    return final_categories
+
 
+@_safe_prompt(lambda: None)
 def get_single_niche() -> Optional[str]:
     """
     Prompt for a single niche (targeted mode).
     """
-    try:
-        niche = questionary.text(
-            "Enter the niche to research deeply:",
-            instruction="(e.g., 'plant identifier apps', 'meditation apps')"
-        ).ask()
-        return niche
-    except KeyboardInterrupt:
-        return None
+    import questionary
 
+    return questionary.text(
+        "Enter the niche to research deeply:",
+        instruction="(e.g., 'plant identifier apps', 'meditation apps')"
+    ).ask()
 
+
+@_safe_prompt(lambda: "general")
 def select_mode() -> str:
     """
     Let user choose between general and targeted mode.
     """
-    try:
-        mode = questionary.select(
-            "Select research mode:",
-            choices=[
-                questionary.Choice(
-                    "General - Scan multiple categories, find best opportunities",
-                    value="general"
-                ),
-                questionary.Choice(
-                    "Targeted - Deep dive into one specific niche (8+ apps)",
-                    value="targeted"
-                ),
-            ]
-        ).ask()
-        return mode or "general"
-    except KeyboardInterrupt:
-        return "general"
+    import questionary
+
+    return questionary.select(
+        "Select research mode:",
+        choices=[
+            questionary.Choice(
+                "General - Scan multiple categories, find best opportunities",
+                value="general"
+            ),
+            questionary.Choice(
+                "Targeted - Deep dive into one specific niche (8+ apps)",
+                value="targeted"
+            ),
+        ]
+    ).ask()
+
+
+def _csv(value: str) -> tuple[str, ...]:
+    """Split a comma-separated list, dropping blanks and surrounding whitespace."""
+    return tuple(part for part in (p.strip() for p in value.split(",")) if part)
 
 
 def parse_args():
     """Parse command line arguments."""
+    # No arguments (plain interactive run) - skip building the parser
+    if len(sys.argv) == 1:
+        return argparse.Namespace(niche=None, debug=False, categories=None, mode=None)
+
     parser = argparse.ArgumentParser(
         description="ALPHY - Deep Clone Research Agent",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -170,7 +229,7 @@ Examples:
 
     parser.add_argument(
         "--categories",
-        type=str,
+        type=_csv,
         default=None,
         help="Comma-separated list of categories (skips interactive selection)"
     )
@@ -190,6 +249,35 @@ Examples:
 # REPORT SAVING
 # =============================================================================
 
+_report_dir_ready = False
+
+# category -> filename slug: spaces become hyphens, "&" becomes "and", and any
+# other ASCII character that isn't alphanumeric or "-" is dropped
+_SLUG_SPELL = str.maketrans({" ": "-", "&": "and"})
+_SLUG_KEEP = frozenset(string.ascii_letters + string.digits + "-")
+_SLUG_DELETE = str.maketrans("", "", "".join(chr(i) for i in range(128) if chr(i) not in _SLUG_KEEP))
+
+
+def _write_report_json(f, data) -> None:
+    """
+    Write data as indented JSON. A top-level dict is written one value at a
+    time, so only the largest value is ever held as encoded bytes.
+    """
+    if not isinstance(data, dict) or not data:
+        f.write(_dumps_report(data))
+        return
+
+    f.write(b"{")
+    sep = b"\n  "
+    for key, value in data.items():
+        # nest the value's own indentation one level deeper; JSON strings
+        # never contain a raw newline, so this only touches whitespace
+        value_bytes = _dumps_report(value).replace(b"\n", b"\n  ")
+        f.write(sep + _dumps_report(key if isinstance(key, str) else str(key)) + b": " + value_bytes)
+        sep = b",\n  "
+    f.write(b"\n}")
+
+
 def save_report(results: dict, categories: List[str]) -> tuple[str, str]:
     """
     Save the research report to files.
@@ -197,34 +285,40 @@ def save_report(results: dict, categories: List[str]) -> tuple[str, str]:
     Returns:
         Tuple of (json_path, markdown_path)
     """
-    import json
+    global _report_dir_ready
 
-    # Create alphy directory if it doesn't exist
-    os.makedirs("alphy", exist_ok=True)
+    # Create alphy directory if it doesn't exist (checked once per process)
+    if not _report_dir_ready:
+        os.makedirs("alphy", exist_ok=True)
+        _report_dir_ready = True
 
     # Generate filename: MM-DD-YY-alphy-{niche}
-    date_str = datetime.now().strftime("%m-%d-%y")
+    today = date.today()
+    date_str = f"{today.month:02d}-{today.day:02d}-{today.year % 100:02d}"
 
     # Create slug from categories
     if categories:
-        niche_slug = categories[0].replace(" ", "-").replace("&", "and").lower()[:20]
+        niche_slug = categories[0].translate(_SLUG_SPELL).lower()[:20]
     else:
         niche_slug = "general"
 
-    # Clean up slug
-    niche_slug = "".join(c if c.isalnum() or c == "-" else "" for c in niche_slug)
+    # Clean up slug (the table only covers ASCII - anything else takes the slow path)
+    if niche_slug.isascii():
+        niche_slug = niche_slug.translate(_SLUG_DELETE)
+    else:
+        niche_slug = "".join(c if c.isalnum() or c == "-" else "" for c in niche_slug)
 
     filename = f"{date_str}-alphy-{niche_slug}"
 
     # Save JSON
     json_path = f"alphy/{filename}.json"
-    with open(json_path, "w") as f:
-        json.dump(results.get("json_output", {}), f, indent=2, default=str)
+    with open(json_path, "wb") as f:
+        _write_report_json(f, results.get("json_output", {}))
 
-    # Save Markdown report
+    # Save Markdown report (a single write() of the encoded text)
     md_path = f"alphy/{filename}.md"
-    with open(md_path, "w") as f:
-        f.write(results.get("output_to_user", "No report generated."))
+    with open(md_path, "wb") as f:
+        f.write(results.get("output_to_user", "No report generated.").encode("utf-8"))
 
     return json_path, md_path
 
@@ -233,25 +327,29 @@ def save_report(results: dict, categories: List[str]) -> tuple[str, str]:
 # PROGRESS DISPLAY
 # =============================================================================
 
+_PHASE_EMOJI = {
+    "init": "🚀",
+    "planning": "📋",
+    "discovery": "🔍",
+    "deep_research": "🔬",
+    "reflection": "🤔",
+    "pattern_extraction": "🧬",
+    "synthesis": "✍️",
+}
+_DEFAULT_PHASE_EMOJI = "⏳"
+
+
 def show_progress(phase: str, detail: str = ""):
-    """Show progress indicator."""
-    console = Console()
-    phase_emoji = {
-        "init": "🚀",
-        "planning": "📋",
-        "discovery": "🔍",
-        "deep_research": "🔬",
-        "reflection": "🤔",
-        "pattern_extraction": "🧬",
-        "synthesis": "✍️",
-    }
-    emoji = phase_emoji.get(phase.lower(), "⏳")
-    console.print(f"{emoji} [bold]{phase}[/bold] {detail}")
+    """Show progress indicator. Phase names are matched exactly (lowercase)."""
+    emoji = _PHASE_EMOJI.get(phase, _DEFAULT_PHASE_EMOJI)
+    _get_console().print(f"{emoji} [bold]{phase}[/bold] {detail}")
 
 
 def show_completion(json_path: str, md_path: str):
     """Show completion message with file paths."""
-    console = Console()
+    from rich.panel import Panel
+
+    console = _get_console()
     console.print()
     console.print(Panel(
         f"[green]✅ Research complete![/green]\n\n"
@@ -264,5 +362,4 @@ def show_completion(json_path: str, md_path: str):
 
 def show_error(message: str):
     """Show error message."""
-    console = Console()
-    console.print(f"[red]❌ Error: {message}[/red]")
+    _get_console().print(f"[red]❌ Error: {message}[/red]")
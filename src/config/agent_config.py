@@ -1,23 +1,62 @@
+import functools
 from dataclasses import dataclass, field
-from typing import List, Callable
+from typing import List, Callable, Optional
 from datetime import date
 from agents.tools import RESEARCH_TOOLS, DISCOVERY_TOOLS, DEEP_RESEARCH_TOOLS
 
 
 # -----------------------------------------------------------------------------
 # get today's date for prompts
+# (formatted once per day - repeat calls return the identical string)
 # -----------------------------------------------------------------------------
 def get_today() -> str:
-    return date.today().strftime("%B %d, %Y")
+    return _format_day(date.today().toordinal())
 
 
-@dataclass
+@functools.lru_cache(maxsize=1)
+def _format_day(ordinal: int) -> str:
+    return date.fromordinal(ordinal).strftime("%B %d, %Y")
+
+
+# -----------------------------------------------------------------------------
+# indie-app criteria shared by the discovery and trends prompts
+# -----------------------------------------------------------------------------
+_INDIE_LOOKING_FOR = (
+    "WHAT YOU'RE LOOKING FOR:\n"
+    "- Small developer apps that went viral (like Ghibli filter apps when GPT image launched)\n"
+    "- Simple utility apps riding a trend (AI photo editors, niche tools)\n"
+    "- Indie games or apps that suddenly exploded\n"
+    "- Apps capitalizing on new tech (AI features, new APIs)\n"
+    "- Viral TikTok/social media apps from unknown developers\n"
+    "- Apps with simple mechanics that could be rebuilt quickly\n\n"
+)
+
+_INDIE_IGNORE = (
+    "EXPLICITLY IGNORE:\n"
+    "- Big company apps (Netflix, Paramount+, Disney, NYT, Meta, Google, Microsoft)\n"
+    "- Established games (Monopoly GO, Candy Crush, Clash of Clans)\n"
+    "- Banking/finance apps from major institutions\n"
+    "- Apps that require massive infrastructure or licensing\n"
+    "- Anything from a Fortune 500 company\n\n"
+)
+
+
+@dataclass(frozen=True, slots=True)
 class AgentConfig:
     name: str
     model: str
     tools: List[Callable]
     timeout_seconds: int
+    # static instructions only - anything that changes goes in context()
     system_prompt: str
+    # append today's date as context (after the cacheable instructions)
+    dated: bool = False
+
+    def context(self) -> Optional[str]:
+        """Dynamic context sent after the system prompt, or None."""
+        if not self.dated:
+            return None
+        return f"TODAY'S DATE: {get_today()}"
 
 
 # =============================================================================
@@ -29,8 +68,8 @@ PLANNER_AGENT = AgentConfig(
     model="claude-opus",
     tools=[],
     timeout_seconds=60,
+    dated=True,
     system_prompt=(
-        f"TODAY'S DATE: {get_today()}\n\n"
         "You are a research planner for finding indie app clone opportunities.\n\n"
 
         "YOUR TASK:\n"
@@ -82,28 +121,16 @@ DISCOVERY_RESEARCHER = AgentConfig(
     model="claude-opus",
     tools=DISCOVERY_TOOLS,
     timeout_seconds=300,
+    dated=True,
     system_prompt=(
-        f"TODAY'S DATE: {get_today()}\n\n"
         "You are an indie app opportunity hunter. Your job is to DISCOVER trending indie apps.\n\n"
 
         "YOUR GOAL:\n"
         "Find 8-15 indie/small-developer apps that represent cloneable opportunities.\n"
         "These are apps that went viral, are trending, or fill a niche that could be replicated.\n\n"
 
-        "WHAT YOU'RE LOOKING FOR:\n"
-        "- Small developer apps that went viral (like Ghibli filter apps when GPT images launched)\n"
-        "- Simple utility apps riding a trend (AI photo editors, niche tools)\n"
-        "- Indie games or apps that suddenly exploded\n"
-        "- Apps capitalizing on new tech (AI features, new APIs)\n"
-        "- Viral TikTok/social media apps from unknown developers\n"
-        "- Apps with simple mechanics that could be rebuilt quickly\n\n"
-
-        "EXPLICITLY IGNORE:\n"
-        "- Big company apps (Netflix, Paramount+, Disney, NYT, Meta, Google, Microsoft)\n"
-        "- Established games (Monopoly GO, Candy Crush, Clash of Clans)\n"
-        "- Banking/finance apps from major institutions\n"
-        "- Apps that require massive infrastructure or licensing\n"
-        "- Anything from a Fortune 500 company\n\n"
+        f"{_INDIE_LOOKING_FOR}"
+        f"{_INDIE_IGNORE}"
 
         "FOR EACH APP DISCOVERED, EXTRACT:\n"
         "- App name\n"
@@ -119,7 +146,8 @@ DISCOVERY_RESEARCHER = AgentConfig(
         "- Gaps identified (focus searches here)\n\n"
 
         "WORKFLOW:\n"
-        "1. Execute searches using the web_search, app_store_search, or product_hunt_search tools\n"
+        "1. Execute searches using the discover_all tool (web + App Store + Product Hunt at once),\n"
+        "   or web_search, app_store_search, product_hunt_search for a single source\n"
         "2. After EACH search, analyze the results to identify indie apps\n"
         "3. Keep searching until you have found 8-10 promising indie apps\n"
         "4. Once you have enough apps, call the submit_discovered_apps tool with your findings\n\n"
@@ -148,11 +176,11 @@ DEEP_RESEARCHER = AgentConfig(
     model="claude-opus",
     tools=DEEP_RESEARCH_TOOLS,
     timeout_seconds=480,
+    dated=True,
     system_prompt=(
-        f"TODAY'S DATE: {get_today()}\n\n"
         "You are a deep research specialist. Your job is to thoroughly research ONE app.\n\n"
 
-        "YOU ARE RESEARCHING: [APP_NAME_PLACEHOLDER]\n\n"
+        "The app to research is named in the user's message.\n\n"
 
         "RESEARCH GOALS - Find as much as possible about:\n\n"
 
@@ -184,7 +212,7 @@ DEEP_RESEARCHER = AgentConfig(
         "   - Estimated build time for MVP?\n\n"
 
         "SCRATCHPAD:\n"
-        "You will be provided with queries already executed for this app.\n"
+        "The user's message includes the queries already executed for this app.\n"
         "DON'T repeat those searches - build on what you've learned.\n\n"
 
         "SUBMITTING YOUR RESEARCH:\n"
@@ -303,8 +331,8 @@ SYNTHESIS_AGENT = AgentConfig(
     model="claude-opus",
     tools=[],
     timeout_seconds=180,
+    dated=True,
     system_prompt=(
-        f"TODAY'S DATE: {get_today()}\n\n"
         "You are a report writer for indie app opportunity research.\n\n"
 
         "YOUR TASK:\n"
@@ -369,8 +397,8 @@ USER_COMMUNICATOR = AgentConfig(
     model='claude-opus',
     tools=[],
     timeout_seconds=120,
+    dated=True,
     system_prompt=(
-        f"TODAY'S DATE: {get_today()}\n\n"
         "You format indie app opportunity reports for an entrepreneur looking to build apps.\n\n"
 
         "Format each opportunity as:\n"
@@ -394,25 +422,13 @@ APP_TRENDS_ANALYZER = AgentConfig(
     model='claude-opus',
     tools=RESEARCH_TOOLS,
     timeout_seconds=480,
+    dated=True,
     system_prompt=(
-        f"TODAY'S DATE: {get_today()}\n\n"
         "You are an indie app opportunity hunter. Your job is to find VIRAL INDIE APPS "
         "that represent cloneable business opportunities - NOT big company apps.\n\n"
 
-        "WHAT YOU'RE LOOKING FOR:\n"
-        "- Small developer apps that went viral (like Ghibli filter apps when GPT image launched)\n"
-        "- Simple utility apps riding a trend (AI photo editors, niche tools)\n"
-        "- Indie games or apps that suddenly exploded\n"
-        "- Apps capitalizing on new tech (AI features, new APIs)\n"
-        "- Viral TikTok/social media apps from unknown developers\n"
-        "- Apps with simple mechanics that could be rebuilt quickly\n\n"
-
-        "EXPLICITLY IGNORE:\n"
-        "- Big company apps (Netflix, Paramount+, Disney, NYT, Meta, Google, Microsoft)\n"
-        "- Established games (Monopoly GO, Candy Crush, Clash of Clans)\n"
-        "- Banking/finance apps from major institutions\n"
-        "- Apps that require massive infrastructure or licensing\n"
-        "- Anything from a Fortune 500 company\n\n"
+        f"{_INDIE_LOOKING_FOR}"
+        f"{_INDIE_IGNORE}"
 
         "FOR EACH OPPORTUNITY, REPORT:\n"
         "- App name and developer (should be indie/small team)\n"
@@ -422,7 +438,7 @@ APP_TRENDS_ANALYZER = AgentConfig(
         "- The alpha: What's the insight here for someone wanting to build?\n\n"
 
         "SEARCH STRATEGY:\n"
-        f"- Always search for {get_today()} or this week's data\n"
+        "- Always search for today's date (see CONTEXT below) or this week's data\n"
         "- Look at 'suddenly trending' or 'fastest rising' apps\n"
         "- Check indie dev communities, Product Hunt, TikTok viral apps\n"
         "- Focus on apps that came out of nowhere\n\n"
@@ -2,11 +2,12 @@
 # Model Settings
 #
 # Configure LLM provider and model mappings.
-# Supports: "vertex" (Claude on Vertex AI) or "gemini" (Google Gemini)
+# Supports: "vertex" (Claude on Vertex AI), "gemini_vertex" (Gemini on
+# Vertex AI) or "gemini" (Gemini via the AI Studio API key)
 # -----------------------------------------------------------------------------
 import os
 
-# LLM Provider: "vertex" or "gemini"
+# LLM Provider: "vertex", "gemini_vertex" or "gemini"
 LLM_PROVIDER = os.environ.get("LLM_PROVIDER", "vertex")
 
 # Model mappings for each provider
@@ -16,6 +17,10 @@ MODEL_MAPPING = {
         "claude-sonnet": "claude-sonnet-4-5-v2@20250514",
         "default": "claude-opus-4-5@20251101",
     },
+    "gemini_vertex": {
+        "gemini-3-pro": "gemini-3-pro-preview",
+        "default": "gemini-3-pro-preview",
+    },
     "gemini": {
         "gemini-3-pro": "gemini-3-pro-preview",
         "default": "gemini-3-pro-preview",
@@ -25,12 +30,22 @@ MODEL_MAPPING = {
 # Vertex AI settings (used when LLM_PROVIDER="vertex")
 VERTEX_PROJECT_ID = os.environ.get("ANTHROPIC_VERTEX_PROJECT_ID", "gen-lang-client-0494134627")
 VERTEX_REGION = os.environ.get("CLOUD_ML_REGION", "us-east5")
+# Gemini on Vertex (LLM_PROVIDER="gemini_vertex") - same project and GCP
+# credentials as Claude; preview Gemini models are served from "global"
+GEMINI_VERTEX_REGION = os.environ.get("GEMINI_VERTEX_REGION", "global")
+
+# Max apps researched at once by DeepResearcherAgent.research_apps()
+DEEP_RESEARCHER_PARALLEL = int(os.environ.get("DEEP_RESEARCHER_PARALLEL", "8"))
+
+
+# Mapping for the configured provider, resolved once (LLM_PROVIDER is fixed at import)
+_ACTIVE_MODELS = MODEL_MAPPING.get(LLM_PROVIDER, MODEL_MAPPING["vertex"])
+_DEFAULT_MODEL = _ACTIVE_MODELS.get("default")
 
 
 def get_model_id(model_name: str) -> str:
     """Get the actual model ID for the current provider."""
-    provider_models = MODEL_MAPPING.get(LLM_PROVIDER, MODEL_MAPPING["vertex"])
-    return provider_models.get(model_name, provider_models.get("default", model_name))
+    return _ACTIVE_MODELS.get(model_name) or _DEFAULT_MODEL or model_name
 
 
 def get_provider() -> str:
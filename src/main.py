@@ -14,14 +14,21 @@ import asyncio
 import sys
 import os
 
-# Ensure src is in path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
+# uvloop is optional - fall back to the stdlib loop where it isn't installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Ensure src is in path for imports. Running `python src/main.py` already puts
+# src/ first on sys.path - only add it (once) when loaded some other way.
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SRC_DIR not in sys.path:
+    sys.path.insert(0, _SRC_DIR)
+
+# cli is light (questionary/rich load on use). .env, the workflow and the agent
+# stack are imported in main() after argument parsing, so --help and argument
+# errors don't pay for LangChain/LangGraph and the provider SDKs.
 from cli import (
     show_banner,
     select_categories,
@@ -33,19 +40,24 @@ from cli import (
     show_completion,
     show_error,
 )
-from workflow import run_workflow
-from agents import print_markdown
 
 
 async def run_research(categories: list, mode: str, debug: bool):
     """Run the async research workflow."""
+    from workflow import run_workflow
+    from agents.tools import aclose_search_http_client
+
     show_progress("Starting", "Deep research workflow...")
 
-    results = await run_workflow(
-        categories=categories,
-        mode=mode,
-        debug=debug,
-    )
+    try:
+        results = await run_workflow(
+            categories=categories,
+            mode=mode,
+            debug=debug,
+        )
+    finally:
+        # release pooled search connections before the event loop closes
+        await aclose_search_http_client()
 
     return results
 
@@ -56,6 +68,10 @@ def main():
     # Parse command line arguments
     args = parse_args()
 
+    # Load environment variables (once per process) - before anything reads settings
+    import _env  # noqa: F401
+    from agents import print_markdown
+
     # Show banner
     show_banner()
 
@@ -70,8 +86,8 @@ def main():
         print(f"\n🎯 Targeted research mode: {args.niche}\n")
 
     # Check for categories argument
-    elif args.categories:
-        categories = [c.strip() for c in args.categories.split(",") if c.strip()]
+    elif args.categories is not None:
+        categories = list(args.categories)
         mode = args.mode or "general"
         print(f"\n📋 Categories: {', '.join(categories)}\n")
 
@@ -109,7 +125,8 @@ def main():
 
     # Run the async workflow
     try:
-        results = asyncio.run(run_research(categories, mode, args.debug))
+        runner = uvloop.run if uvloop is not None else asyncio.run
+        results = runner(run_research(categories, mode, args.debug))
 
         # Check for errors
         errors = results.get("errors", [])
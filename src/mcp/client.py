@@ -3,6 +3,7 @@
 import asyncio
 import logging
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Any, AsyncGenerator
 
 from mcp import ClientSession
@@ -13,12 +14,39 @@ from .config import get_server_config, MCPServerConfig
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class _ServerHandle:
+    """A live server connection: the session plus the task that owns it."""
+    session: ClientSession
+    owner: asyncio.Task
+    stop: asyncio.Event
+
+
+def _extract_content(result: Any) -> Any:
+    """Unwrap a call_tool result: the text of a single block, else a list."""
+    if hasattr(result, 'content') and result.content:
+        # MCP returns content as a list of content blocks
+        if len(result.content) == 1:
+            content = result.content[0]
+            if hasattr(content, 'text'):
+                return content.text
+        return [c.text if hasattr(c, 'text') else c for c in result.content]
+
+    return result
+
+
 class MCPClient:
     """Client for connecting to and calling MCP servers."""
 
+    __slots__ = ("_servers", "_connect_locks", "_tools_cache")
+
     def __init__(self):
-        self._sessions: dict[str, ClientSession] = {}
-        self._contexts: dict[str, Any] = {}
+        self._servers: dict[str, _ServerHandle] = {}
+        # one lock per server, so concurrent first calls share one process
+        # while different servers still start in parallel
+        self._connect_locks: dict[str, asyncio.Lock] = {}
+        # tool schemas don't change while a server is up - cleared on disconnect
+        self._tools_cache: dict[str, tuple[dict[str, Any], ...]] = {}
 
     async def connect(self, server_name: str) -> ClientSession:
         """
@@ -30,9 +58,20 @@ class MCPClient:
         Returns:
             ClientSession for making tool calls
         """
-        if server_name in self._sessions:
-            return self._sessions[server_name]
-
+        handle = self._servers.get(server_name)
+        if handle is not None:
+            return handle.session
+
+        lock = self._connect_locks.setdefault(server_name, asyncio.Lock())
+        async with lock:
+            # another caller may have connected while we waited
+            handle = self._servers.get(server_name)
+            if handle is not None:
+                return handle.session
+            return await self._start_server(server_name)
+
+    async def _start_server(self, server_name: str) -> ClientSession:
+        """Spawn the server process (in its owner task) and wait for the MCP handshake."""
         config = get_server_config(server_name)
 
         server_params = StdioServerParameters(
@@ -42,18 +81,19 @@ class MCPClient:
             env=config.get("env"),
         )
 
-        # Create stdio connection (store context for cleanup)
-        stdio_ctx = stdio_client(server_params)
-        read_stream, write_stream = await stdio_ctx.__aenter__()
-        self._contexts[f"{server_name}_stdio"] = stdio_ctx
-
-        # Create session (don't use async with - we manage lifecycle manually)
-        session = ClientSession(read_stream, write_stream)
-        await session.__aenter__()
-        await session.initialize()
+        ready = asyncio.get_running_loop().create_future()
+        stop = asyncio.Event()
+        owner = asyncio.create_task(
+            _own_server(server_name, server_params, ready, stop),
+            name=f"mcp-server-{server_name}",
+        )
+        try:
+            session = await ready
+        except BaseException:
+            owner.cancel()
+            raise
 
-        self._sessions[server_name] = session
-        self._contexts[f"{server_name}_session"] = session
+        self._servers[server_name] = _ServerHandle(session, owner, stop)
         logger.info(f"Connected to MCP server: {server_name}")
         return session
 
@@ -74,24 +114,16 @@ class MCPClient:
         Returns:
             Tool result
         """
-        session = await self.connect(server_name)
+        handle = self._servers.get(server_name)
+        session = handle.session if handle is not None else await self.connect(server_name)
 
         result = await session.call_tool(tool_name, arguments or {})
-
-        # Extract content from result
-        if hasattr(result, 'content') and result.content:
-            # MCP returns content as a list of content blocks
-            if len(result.content) == 1:
-                content = result.content[0]
-                if hasattr(content, 'text'):
-                    return content.text
-            return [c.text if hasattr(c, 'text') else c for c in result.content]
-
-        return result
+        return _extract_content(result)
 
     async def list_tools(self, server_name: str) -> list[dict[str, Any]]:
         """
         List available tools on an MCP server.
+        Fetched once per connection; each call returns fresh dicts built from that.
 
         Args:
             server_name: Name of the MCP server
@@ -99,17 +131,23 @@ class MCPClient:
         Returns:
             List of tool definitions
         """
-        session = await self.connect(server_name)
-        result = await session.list_tools()
-
-        return [
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "inputSchema": tool.inputSchema if hasattr(tool, 'inputSchema') else {},
-            }
-            for tool in result.tools
-        ]
+        tools = self._tools_cache.get(server_name)
+        if tools is None:
+            session = await self.connect(server_name)
+            result = await session.list_tools()
+
+            tools = tuple(
+                {
+                    "name": tool.name,
+                    "description": tool.description,
+                    "inputSchema": tool.inputSchema if hasattr(tool, 'inputSchema') else {},
+                }
+                for tool in result.tools
+            )
+            self._tools_cache[server_name] = tools
+
+        # copies, so callers can't alter the cached definitions
+        return [dict(tool) for tool in tools]
 
     async def disconnect(self, server_name: str | None = None):
         """
@@ -121,57 +159,59 @@ class MCPClient:
         if server_name:
             await self._cleanup_server(server_name)
         else:
-            for name in list(self._sessions.keys()):
+            for name in list(self._servers):
                 await self._cleanup_server(name)
             logger.info("Disconnected from all MCP servers")
 
     async def _cleanup_server(self, server_name: str):
         """Clean up a single server connection."""
-        # Clean up session
-        session_key = f"{server_name}_session"
-        if session_key in self._contexts:
-            try:
-                await self._contexts[session_key].__aexit__(None, None, None)
-            except Exception as e:
-                logger.warning(f"Error closing session for {server_name}: {e}")
-            del self._contexts[session_key]
-
-        # Clean up stdio connection
-        stdio_key = f"{server_name}_stdio"
-        if stdio_key in self._contexts:
-            try:
-                await self._contexts[stdio_key].__aexit__(None, None, None)
-            except Exception as e:
-                logger.warning(f"Error closing stdio for {server_name}: {e}")
-            del self._contexts[stdio_key]
-
-        # Remove session reference
-        if server_name in self._sessions:
-            del self._sessions[server_name]
-            logger.info(f"Disconnected from MCP server: {server_name}")
+        self._tools_cache.pop(server_name, None)
+        handle = self._servers.pop(server_name, None)
+        if handle is None:
+            return
+
+        # the owner task closes the session and stdio contexts it entered
+        handle.stop.set()
+        try:
+            await handle.owner
+        except Exception as e:
+            logger.warning(f"Error closing MCP server {server_name}: {e}")
+
+        logger.info(f"Disconnected from MCP server: {server_name}")
 
     async def disconnect_all(self):
         """Disconnect from all MCP servers."""
         await self.disconnect(None)
 
 
-@asynccontextmanager
-async def mcp_client() -> AsyncGenerator[MCPClient, None]:
+async def _own_server(
+    server_name: str,
+    server_params: StdioServerParameters,
+    ready: asyncio.Future,
+    stop: asyncio.Event,
+):
     """
-    Context manager for MCP client.
-
-    Usage:
-        async with mcp_client() as client:
-            result = await client.call_tool("app_store", "search_app", {"term": "habit tracker"})
+    Owner task for one server connection. stdio_client and ClientSession hold
+    anyio cancel scopes, which must be exited by the task that entered them -
+    so both are entered and exited here, whichever task connects or disconnects.
     """
-    client = MCPClient()
     try:
-        yield client
-    finally:
-        await client.disconnect_all()
+        async with stdio_client(server_params) as (read_stream, write_stream):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
+                if ready.cancelled():
+                    return  # the connecting caller gave up while we started
+                ready.set_result(session)
+                await stop.wait()
+    except Exception as e:
+        if not ready.done():
+            ready.set_exception(e)
+        else:
+            logger.warning(f"MCP server {server_name} stopped with an error: {e}")
 
 
-# Singleton instance for simple usage
+# Singleton instance - server processes are started once and shared by every
+# caller (mcp_client(), call_tool(), the src/tools wrappers) until shutdown_mcp()
 _client: MCPClient | None = None
 
 
@@ -183,6 +223,30 @@ async def get_client() -> MCPClient:
     return _client
 
 
+async def shutdown_mcp():
+    """
+    Disconnect the shared client's servers - call once, when the run is done.
+    Safe from any task. The client itself stays the singleton, so a later call
+    reconnects on it and the next shutdown_mcp() closes that too.
+    """
+    if _client is not None:
+        await _client.disconnect_all()
+
+
+@asynccontextmanager
+async def mcp_client() -> AsyncGenerator[MCPClient, None]:
+    """
+    Context manager for the shared MCP client.
+    Servers stay connected on exit so later callers reuse them - call
+    shutdown_mcp() when the run is done.
+
+    Usage:
+        async with mcp_client() as client:
+            result = await client.call_tool("app_store", "search_app", {"term": "habit tracker"})
+    """
+    yield await get_client()
+
+
 async def call_tool(server_name: str, tool_name: str, arguments: dict[str, Any] | None = None) -> Any:
     """
     Convenience function to call a tool.
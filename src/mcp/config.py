@@ -2,7 +2,8 @@
 
 import os
 from pathlib import Path
-from typing import TypedDict, Optional
+from types import MappingProxyType
+from typing import Mapping, TypedDict, Optional
 
 # Project root directory
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -16,30 +17,45 @@ class MCPServerConfig(TypedDict, total=False):
     env: dict[str, str]
 
 
-# MCP Server Definitions
-MCP_SERVERS: dict[str, MCPServerConfig] = {
-    "app_store": {
+# MCP Server Definitions (read-only - paths are resolved once, here)
+MCP_SERVERS: Mapping[str, Mapping] = MappingProxyType({
+    "app_store": MappingProxyType({
         "command": "node",
-        "args": ["server.js"],
+        "args": ("server.js",),
         "cwd": str(PROJECT_ROOT / "mcp-servers" / "mcp-appstore"),
-        "env": {},
-    },
-    "product_hunt": {
+        "env": MappingProxyType({}),
+    }),
+    "product_hunt": MappingProxyType({
         "command": str(PROJECT_ROOT / ".venv" / "bin" / "product-hunt-mcp"),
-        "args": [],
+        "args": (),
         "cwd": str(PROJECT_ROOT),
-        "env": {
-            "PRODUCT_HUNT_TOKEN": os.getenv("PRODUCT_HUNT_TOKEN", ""),
-        },
-    },
-}
+        "env": MappingProxyType({}),
+    }),
+})
+
+# Variables copied from the current environment into a server's env each time
+# it's resolved, so a rotated token is picked up by the next server start
+_ENV_FROM_PROCESS: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "product_hunt": ("PRODUCT_HUNT_TOKEN",),
+})
 
 
 def get_server_config(server_name: str) -> MCPServerConfig:
-    """Get configuration for a specific MCP server."""
+    """Get configuration for a specific MCP server (a fresh copy per call)."""
     if server_name not in MCP_SERVERS:
         raise ValueError(f"Unknown MCP server: {server_name}. Available: {list(MCP_SERVERS.keys())}")
-    return MCP_SERVERS[server_name]
+    base = MCP_SERVERS[server_name]
+
+    env = dict(base["env"])
+    for name in _ENV_FROM_PROCESS.get(server_name, ()):
+        env[name] = os.environ.get(name, "")
+
+    return {
+        "command": base["command"],
+        "args": list(base["args"]),
+        "cwd": base["cwd"],
+        "env": env,
+    }
 
 
 def get_available_servers() -> list[str]:
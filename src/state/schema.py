@@ -23,7 +23,7 @@ class ResearchPhase(str, Enum):
 # -----------------------------------------------------------------------------
 # SubQuery - A planned search query
 # -----------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class SubQuery:
     query: str
     purpose: str  # e.g., "find viral apps", "get revenue data"
@@ -34,7 +34,7 @@ class SubQuery:
 # -----------------------------------------------------------------------------
 # AppOpportunity - Structured data for a single app
 # -----------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class AppOpportunity:
     name: str
     developer: str = ""
@@ -56,12 +56,17 @@ class AppOpportunity:
     sources: List[str] = field(default_factory=list)
     raw_research: str = ""  # raw research data for this app
     research_complete: bool = False
+    # lowercased name, computed once - the dedup key used by add_apps
+    name_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.name_key = self.name.lower()
 
 
 # -----------------------------------------------------------------------------
 # ResearchScratchpad - Tracks what's been searched to avoid redundancy
 # -----------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class ResearchScratchpad:
     executed_queries: List[str] = field(default_factory=list)
     key_findings: List[str] = field(default_factory=list)
@@ -72,7 +77,7 @@ class ResearchScratchpad:
 # -----------------------------------------------------------------------------
 # Pattern - Cross-app pattern extracted during analysis
 # -----------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class Pattern:
     name: str
     description: str
@@ -89,11 +94,11 @@ def add_apps(existing: List[AppOpportunity], new: List[AppOpportunity]) -> List[
         existing = []
     if not new:
         return existing
-    existing_names = {app.name.lower() for app in existing}
+    existing_names = {app.name_key for app in existing}
     for app in new:
-        if app.name.lower() not in existing_names:
+        if app.name_key not in existing_names:
             existing.append(app)
-            existing_names.add(app.name.lower())
+            existing_names.add(app.name_key)
     return existing
 
 
@@ -104,9 +109,13 @@ def merge_scratchpad(existing: ResearchScratchpad, new: ResearchScratchpad) -> R
     if not new:
         return existing
 
+    # set membership - these lists grow over a run and the reducer runs every tick
+    seen_queries = set(existing.executed_queries)
+    seen_findings = set(existing.key_findings)
+
     return ResearchScratchpad(
-        executed_queries=existing.executed_queries + [q for q in new.executed_queries if q not in existing.executed_queries],
-        key_findings=existing.key_findings + [f for f in new.key_findings if f not in existing.key_findings],
+        executed_queries=existing.executed_queries + [q for q in new.executed_queries if q not in seen_queries],
+        key_findings=existing.key_findings + [f for f in new.key_findings if f not in seen_findings],
         gaps_identified=new.gaps_identified if new.gaps_identified else existing.gaps_identified,
         iteration_count=max(existing.iteration_count, new.iteration_count),
     )
@@ -6,7 +6,9 @@
 # -----------------------------------------------------------------------------
 
 import json
+import logging
 import re
+from datetime import date
 from typing import List, Dict, Any, Optional
 from dataclasses import asdict
 
@@ -17,6 +19,9 @@ from state.schema import (
     Pattern,
 )
 
+# same logger as agents.base (configured there)
+logger = logging.getLogger("agents")
+
 
 # =============================================================================
 # SCRATCHPAD FORMATTING
@@ -85,9 +90,6 @@ def extract_json_from_response(content: str) -> Optional[Any]:
     """
     Extract JSON from LLM response that might contain markdown code blocks.
     """
-    import logging
-    logger = logging.getLogger("agents")
-
     # Try to find JSON in code blocks first
     json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', content)
     if json_match:
@@ -370,7 +372,6 @@ def generate_default_queries(categories: List[str]) -> List[SubQuery]:
     """
     Generate default research queries if planner fails.
     """
-    from datetime import date
     today = date.today()
     month = today.strftime("%B")
     year = today.year
@@ -432,8 +433,6 @@ def build_json_output(
     """
     Build the final JSON output structure.
     """
-    from datetime import date
-
     # Convert apps to dict format
     opportunities = []
     for app in apps:
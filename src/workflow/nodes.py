@@ -14,7 +14,7 @@
 #                    pattern_extraction → synthesis → END
 # -----------------------------------------------------------------------------
 
-from typing import Dict, Any, List
+from typing import Dict, Any
 from langchain_core.messages import HumanMessage
 
 from state.schema import (
@@ -290,161 +290,83 @@ What would you like to do?""")
     }
 
 
-def extract_apps_from_messages(messages) -> List[AppOpportunity]:
-    """
-    Extract app names and URLs from tool result messages as a fallback.
-    Looks for app names mentioned in search results along with their source URLs.
-    """
-    apps = []
-    app_names_found = set()
-
-    for msg in messages:
-        content = ""
-        if hasattr(msg, 'content'):
-            if isinstance(msg.content, str):
-                content = msg.content
-            elif isinstance(msg.content, list):
-                content = " ".join(str(c) for c in msg.content)
-
-        # Parse search results which have Title/URL/Content format
-        current_url = ""
-        lines = content.split('\n')
-
-        for i, line in enumerate(lines):
-            line = line.strip()
-
-            # Capture URL for the current result
-            if line.startswith('URL:') or line.startswith('Source:'):
-                current_url = line.split(':', 1)[1].strip() if ':' in line else ""
-
-            # Look for "Title:" lines from search results
-            if line.startswith('Title:'):
-                title = line.replace('Title:', '').strip()
-
-                # Extract potential app name (first part before common separators)
-                for sep in [' - ', ' | ', ' : ', ' – ', ' — ']:
-                    if sep in title:
-                        potential_name = title.split(sep)[0].strip()
-                        # Filter out generic terms
-                        skip_terms = [
-                            'the', 'best', 'top', 'new', 'app', 'apps', 'review',
-                            'download', 'free', 'how', 'what', 'why', '2024', '2025', '2026'
-                        ]
-                        if len(potential_name) > 2 and potential_name.lower() not in skip_terms:
-                            if potential_name not in app_names_found:
-                                app_names_found.add(potential_name)
-                                apps.append(AppOpportunity(
-                                    name=potential_name,
-                                    why_viral="Found in trending search results",
-                                    sources=[current_url] if current_url else [],
-                                ))
-                        break
-
-    return apps[:15]  # Limit to 15 apps
+def apply_submitted_research(app: AppOpportunity, research: Dict[str, Any]) -> AppOpportunity:
+    """Copy submit_app_research args onto the app and mark it researched."""
+    app.developer = research.get("developer", app.developer)
+    app.category = research.get("category", app.category)
+    app.revenue_estimate = research.get("revenue_estimate", "unknown")
+    app.downloads_estimate = research.get("downloads_estimate", "unknown")
+    app.rating = research.get("rating")
+    app.hook_feature = research.get("hook_feature", "")
+    app.differentiation_angle = research.get("differentiation_angle", "")
+    app.why_viral = research.get("why_viral", app.why_viral)
+    app.growth_strategy = research.get("growth_strategy", "")
+    app.clone_difficulty = research.get("clone_difficulty", 3)
+    app.mvp_features = research.get("mvp_features", [])
+    app.skip_features = research.get("skip_features", [])
+    app.clone_lessons = research.get("clone_lessons", "")
+    app.sources = research.get("sources", app.sources)
+    app.research_complete = True
+    return app
 
 
 # -----------------------------------------------------------------------------
 # deep_research_node
-# Deep dives on ONE app at a time
+# Deep dives on every app not yet researched, several at once
+# (each app runs its own tool loop inside DeepResearcherAgent)
 # -----------------------------------------------------------------------------
 async def deep_research_node(state: AgentState) -> Dict[str, Any]:
-    """Deep research on the current app."""
+    """Deep research on all remaining apps."""
     apps = state.get("discovered_apps", [])
     current_index = state.get("current_app_index", 0)
-    scratchpad = state.get("scratchpad", ResearchScratchpad())
-    deep_messages = state.get("deep_research_messages", [])
 
-    # Check if we've researched all apps
-    if current_index >= len(apps):
+    pending = apps[current_index:]
+    if not pending:
         logger.info("[deep_research] All apps researched, moving to reflection")
         return {
             "current_phase": ResearchPhase.REFLECTION,
             "deep_research_messages": [],  # Clear for next round
         }
 
-    current_app = apps[current_index]
-    is_first_call = len(deep_messages) == 0
-
-    logger.info(f"[deep_research] Researching app {current_index + 1}/{len(apps)}: {current_app.name}")
-
-    if is_first_call:
-        # Start fresh research on this app
-        scratchpad_text = format_app_scratchpad(current_app, [])
+    logger.info(f"[deep_research] Researching apps {current_index + 1}-{len(apps)} of {len(apps)}")
 
-        result = await get_deep_research_agent().research_app(
-            app_name=current_app.name,
-            app_description=current_app.why_viral,
-            scratchpad_text=scratchpad_text,
-        )
-    else:
-        # Continue with existing messages (after tool execution)
-        result = await get_deep_research_agent().run({
-            "user_request": "",
-            "messages": deep_messages,
-        })
-
-    # Check for tool calls
-    if result.has_tool_calls:
-        # Check if this is the submit_app_research output tool
-        for tool_call in result.messages[-1].tool_calls:
-            if tool_call.get("name") == "submit_app_research":
-                # Extract research from tool call args - no parsing needed!
-                research = tool_call.get("args", {}).get("research", {})
-                logger.info(f"[deep_research] Got research from submit_app_research tool")
-
-                # Update the app with research data
-                updated_app = current_app
-                updated_app.developer = research.get("developer", updated_app.developer)
-                updated_app.category = research.get("category", updated_app.category)
-                updated_app.revenue_estimate = research.get("revenue_estimate", "unknown")
-                updated_app.downloads_estimate = research.get("downloads_estimate", "unknown")
-                updated_app.rating = research.get("rating")
-                updated_app.hook_feature = research.get("hook_feature", "")
-                updated_app.differentiation_angle = research.get("differentiation_angle", "")
-                updated_app.why_viral = research.get("why_viral", updated_app.why_viral)
-                updated_app.growth_strategy = research.get("growth_strategy", "")
-                updated_app.clone_difficulty = research.get("clone_difficulty", 3)
-                updated_app.mvp_features = research.get("mvp_features", [])
-                updated_app.skip_features = research.get("skip_features", [])
-                updated_app.clone_lessons = research.get("clone_lessons", "")
-                updated_app.sources = research.get("sources", updated_app.sources)
-                updated_app.research_complete = True
-
-                # Create updated apps list
-                updated_apps = apps.copy()
-                updated_apps[current_index] = updated_app
-
-                logger.info(f"[deep_research] Completed research on {current_app.name}")
-
-                return {
-                    "discovered_apps": updated_apps,
-                    "current_app_index": current_index + 1,
-                    "deep_research_messages": [],  # Clear for next app
-                    "current_phase": ResearchPhase.DEEP_RESEARCH,  # Loop to next app
-                }
-
-        # Not the output tool - must be search tools, continue the loop
-        logger.info(f"[deep_research] Agent requesting search tools for {current_app.name}")
-        return {
-            "deep_research_messages": result.messages,
-            "current_phase": ResearchPhase.DEEP_RESEARCH,
+    results = await get_deep_research_agent().research_apps([
+        {
+            "app_name": app.name,
+            "app_description": app.why_viral,
+            "scratchpad_text": format_app_scratchpad(app, []),
         }
+        for app in pending
+    ])
 
-    # No tool calls - fallback to parsing (shouldn't happen with new approach)
-    logger.warning("[deep_research] No tool calls - falling back to text parsing")
-    updated_app = update_app_with_research(current_app, result.content)
-
-    # Create updated apps list
     updated_apps = apps.copy()
-    updated_apps[current_index] = updated_app
-
-    logger.info(f"[deep_research] Completed research on {current_app.name}")
+    for index, (app, result) in enumerate(zip(pending, results), start=current_index):
+        if isinstance(result, BaseException):
+            logger.warning(f"[deep_research] Research failed for {app.name}: {result!r}")
+            continue
+
+        # Extract research from the submit_app_research call args - no parsing needed!
+        research = None
+        if result.has_tool_calls:
+            for tool_call in result.messages[-1].tool_calls:
+                if tool_call.get("name") == "submit_app_research":
+                    research = tool_call.get("args", {}).get("research", {})
+                    break
+
+        if research is not None:
+            updated_apps[index] = apply_submitted_research(app, research)
+        else:
+            # No submission - fallback to parsing (shouldn't happen with new approach)
+            logger.warning(f"[deep_research] No submit_app_research for {app.name} - falling back to text parsing")
+            updated_apps[index] = update_app_with_research(app, result.content)
+
+        logger.info(f"[deep_research] Completed research on {app.name}")
 
     return {
         "discovered_apps": updated_apps,
-        "current_app_index": current_index + 1,
-        "deep_research_messages": [],  # Clear for next app
-        "current_phase": ResearchPhase.DEEP_RESEARCH,  # Loop to next app
+        "current_app_index": len(apps),
+        "deep_research_messages": [],  # Clear for next round
+        "current_phase": ResearchPhase.REFLECTION,
     }
 
 
@@ -33,7 +33,7 @@ def route_after_discovery(state: AgentState) -> Literal["discovery_tools", "deep
 
     last_message = discovery_messages[-1]
 
-    if hasattr(last_message, "tool_calls") and last_message.tool_calls:
+    if getattr(last_message, "tool_calls", None):
         return "discovery_tools"
 
     return "deep_research"
@@ -62,7 +62,7 @@ def route_after_deep_research(state: AgentState) -> Literal["deep_research_tools
     # Check for tool calls
     if deep_messages:
         last_message = deep_messages[-1]
-        if hasattr(last_message, "tool_calls") and last_message.tool_calls:
+        if getattr(last_message, "tool_calls", None):
             return "deep_research_tools"
 
     # Check if more apps to research
@@ -113,7 +113,7 @@ def should_use_tools(state: AgentState) -> Literal["tools", "user_communication"
 
     last_message = messages[-1]
 
-    if hasattr(last_message, "tool_calls") and last_message.tool_calls:
+    if getattr(last_message, "tool_calls", None):
         return "tools"
 
     return "user_communication"
@@ -130,7 +130,7 @@ def check_discovery_tools(state: AgentState) -> Literal["discovery_tools", "deep
 
     last_message = discovery_messages[-1]
 
-    if hasattr(last_message, "tool_calls") and last_message.tool_calls:
+    if getattr(last_message, "tool_calls", None):
         return "discovery_tools"
 
     return "deep_research"
@@ -147,7 +147,7 @@ def check_deep_research_tools(state: AgentState) -> Literal["deep_research_tools
 
     last_message = deep_messages[-1]
 
-    if hasattr(last_message, "tool_calls") and last_message.tool_calls:
+    if getattr(last_message, "tool_calls", None):
         return "deep_research_tools"
 
     return "check_more_apps"
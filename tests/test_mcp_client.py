@@ -0,0 +1,105 @@
+"""
+MCP client lifecycle tests.
+
+Server processes are replaced by fakes that behave like anyio cancel scopes:
+exiting them from a different task than the one that entered them raises.
+
+Run from the project root:
+    uv run python -m unittest discover -s tests -t .
+"""
+
+import asyncio
+import unittest
+
+try:
+    from src.mcp import client as mcp_module
+except ImportError as e:  # the mcp package isn't installed
+    raise unittest.SkipTest(f"mcp not available: {e}")
+
+
+class _TaskBoundContext:
+    """Async context that, like an anyio cancel scope, must exit in its entering task."""
+
+    instances: list["_TaskBoundContext"] = []
+
+    def __init__(self, *args, **kwargs):
+        self.entered_in = None
+        self.exited = False
+        _TaskBoundContext.instances.append(self)
+
+    async def __aenter__(self):
+        self.entered_in = asyncio.current_task()
+        return self._value()
+
+    async def __aexit__(self, *exc_info):
+        if asyncio.current_task() is not self.entered_in:
+            raise RuntimeError("Attempted to exit cancel scope in a different task than it was entered in")
+        self.exited = True
+        return False
+
+    def _value(self):
+        return self
+
+
+class _FakeStdio(_TaskBoundContext):
+    def _value(self):
+        return ("read", "write")
+
+
+class _FakeSession(_TaskBoundContext):
+    async def initialize(self):
+        pass
+
+
+class MCPClientLifecycleTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        _TaskBoundContext.instances.clear()
+        self._originals = (mcp_module.stdio_client, mcp_module.ClientSession, mcp_module._client)
+        mcp_module.stdio_client = _FakeStdio
+        mcp_module.ClientSession = _FakeSession
+        mcp_module._client = None
+
+    def tearDown(self):
+        mcp_module.stdio_client, mcp_module.ClientSession, mcp_module._client = self._originals
+
+    async def test_connect_and_disconnect_in_different_tasks(self):
+        client = mcp_module.MCPClient()
+
+        session = await asyncio.create_task(client.connect("app_store"))
+        self.assertIsInstance(session, _FakeSession)
+
+        await asyncio.create_task(client.disconnect("app_store"))
+
+        self.assertEqual(len(_TaskBoundContext.instances), 2)
+        for context in _TaskBoundContext.instances:
+            self.assertTrue(context.exited)
+
+    async def test_mcp_client_exit_keeps_servers_for_other_callers(self):
+        async with mcp_module.mcp_client() as client:
+            await client.connect("app_store")
+
+        shared = await mcp_module.get_client()
+        self.assertIs(shared, client)
+        self.assertIn("app_store", shared._servers)
+        self.assertFalse(any(context.exited for context in _TaskBoundContext.instances))
+
+        await asyncio.create_task(mcp_module.shutdown_mcp())
+        self.assertTrue(all(context.exited for context in _TaskBoundContext.instances))
+
+    async def test_shutdown_keeps_the_singleton(self):
+        client = await mcp_module.get_client()
+        await client.connect("app_store")
+
+        await mcp_module.shutdown_mcp()
+        self.assertIs(await mcp_module.get_client(), client)
+
+        # a later call reconnects on the same client, which the next shutdown closes
+        await client.connect("app_store")
+        await mcp_module.shutdown_mcp()
+        self.assertEqual(client._servers, {})
+        self.assertTrue(all(context.exited for context in _TaskBoundContext.instances))
+
+
+if __name__ == "__main__":
+    unittest.main()